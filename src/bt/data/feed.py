@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from bt.core.types import Bar
 
@@ -22,11 +25,28 @@ def _is_present(value: object) -> bool:
 
 class HistoricalDataFeed:
     def __init__(self, bars: pd.DataFrame) -> None:
+        self._init_rows(bars, (row for _, row in bars.iterrows()))
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> HistoricalDataFeed:
+        """
+        Build a feed from a pyarrow Table, materializing rows column-wise instead of via DataFrame.iterrows.
+        """
+        ts_index = table.schema.get_field_index("ts")
+        ts_type = table.schema.field(ts_index).type
+        if pa.types.is_timestamp(ts_type) and ts_type.unit != "ns":
+            # Nanosecond timestamps come back from Arrow as pd.Timestamp, matching the DataFrame path.
+            table = table.set_column(ts_index, "ts", table.column(ts_index).cast(pa.timestamp("ns", tz=ts_type.tz)))
+        feed = cls.__new__(cls)
+        feed._init_rows(table.to_pandas(), table.to_pylist())
+        return feed
+
+    def _init_rows(self, bars: pd.DataFrame, rows: Iterable[Mapping[str, Any]]) -> None:
         self._bars = bars
         self._index = 0
         self._timestamps: list[pd.Timestamp] = sorted(bars["ts"].unique())
-        self._rows_by_ts: dict[pd.Timestamp, list[pd.Series]] = defaultdict(list)
-        for _, row in bars.iterrows():
+        self._rows_by_ts: dict[pd.Timestamp, list[Mapping[str, Any]]] = defaultdict(list)
+        for row in rows:
             self._rows_by_ts[row["ts"]].append(row)
 
     def symbols(self) -> list[str]:
@@ -350,12 +350,16 @@ class TradesCsvWriter:
         run_id: str | None = None,
         hypothesis_id: str | None = None,
         tier: str | None = None,
+        force_flush_after: int | None = 1,
     ):
+        """``force_flush_after=None`` leaves rows in the file buffer until ``close()``."""
         path.parent.mkdir(parents=True, exist_ok=True)
         self._path = path
         self._run_id = run_id
         self._hypothesis_id = hypothesis_id
         self._tier = tier
+        self._force_flush_after = None if force_flush_after is None else max(int(force_flush_after), 1)
+        self._pending_rows = 0
         self._columns = list(type(self)._columns)
         file_exists = path.exists()
         self._file = path.open("a", encoding="utf-8", newline="")
@@ -588,8 +592,12 @@ class TradesCsvWriter:
                 value = getattr(trade, column, "")  # TODO: populate when Trade adds field.
             row.append(self._serialize_value(value))
         self._writer.writerow(row)
-        self._file.flush()
+        self._pending_rows += 1
+        if self._force_flush_after is not None and self._pending_rows >= self._force_flush_after:
+            self._file.flush()
+            self._pending_rows = 0
 
     def close(self) -> None:
         if not self._file.closed:
+            self._file.flush()
             self._file.close()
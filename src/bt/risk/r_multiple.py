@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 def compute_r_multiple(pnl: float, risk_amount: Optional[float]) -> Optional[float]:
     """
@@ -13,3 +16,14 @@ def compute_r_multiple(pnl: float, risk_amount: Optional[float]) -> Optional[flo
     if risk_amount <= 0:
         return None
     return pnl / risk_amount
+
+
+def compute_r_multiple_arr(pnl: ArrayLike, risk_amount: ArrayLike) -> np.ndarray:
+    """
+    Vectorized ``compute_r_multiple``: element-wise pnl / risk_amount, NaN where risk is not > 0.
+    """
+    risk = np.asarray(risk_amount, dtype=np.float64)
+    pnl_arr = np.asarray(pnl, dtype=np.float64)
+    out = np.full(np.broadcast(pnl_arr, risk).shape, np.nan, dtype=np.float64)
+    np.divide(pnl_arr, risk, out=out, where=risk > 0)
+    return out
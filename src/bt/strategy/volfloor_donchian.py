@@ -17,6 +17,7 @@ from bt.strategy import register_strategy
 
 
 _EXIT_TYPES = {"donchian_reversal", "chandelier", "partial_donchian", "partial_chandelier"}
+_STOP_MODES = {"structural", "atr", "hybrid"}
 
 
 @dataclass
@@ -67,6 +68,9 @@ class VolFloorDonchianStrategy(Strategy):
         if exit_type not in _EXIT_TYPES:
             allowed = ", ".join(sorted(_EXIT_TYPES))
             raise ValueError(f"Unsupported exit_type={exit_type!r}. Allowed: {allowed}")
+        if stop_mode not in _STOP_MODES:
+            allowed = ", ".join(sorted(_STOP_MODES))
+            raise ValueError(f"Unsupported stop_mode={stop_mode!r}. Allowed: {allowed}")
         if chandelier_lookback <= 0:
             raise ValueError("chandelier_lookback must be > 0")
         if chandelier_mult <= 0:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from bisect import bisect_right
 from collections import deque
+from collections.abc import Iterable
 from typing import Deque
 
 import pandas as pd
@@ -81,6 +82,12 @@ class UniverseEngine:
             decision = pending.popleft()
             self._publish_decision(symbol, bar.ts, decision)
 
+    def update_many(self, bars: Iterable[Bar]) -> None:
+        """Consume bars in order; equivalent to calling update() for each."""
+        update = self.update
+        for bar in bars:
+            update(bar)
+
     def tradeable_at(self, ts: pd.Timestamp) -> set[str]:
         """Return tradeable symbols at timestamp ts based on lagged info."""
         if ts.tz is None:
@@ -26,7 +26,7 @@ from bt.strategy.coinflip import CoinFlipStrategy
 from bt.universe.universe import UniverseEngine
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StressScenario:
     name: str
     fee_mult: float = 1.0
@@ -201,7 +201,7 @@ def run_stress_suite(
 
         decisions_writer = JsonlWriter(run_dir / "decisions.jsonl")
         fills_writer = JsonlWriter(run_dir / "fills.jsonl")
-        trades_writer = TradesCsvWriter(run_dir / "trades.csv")
+        trades_writer = TradesCsvWriter(run_dir / "trades.csv", force_flush_after=None)
         equity_path = run_dir / "equity.csv"
 
         engine = BacktestEngine(
@@ -6,9 +6,21 @@ import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
+ENGINE_CONFIG = ROOT / "configs" / "engine.yaml"
+SAMPLE_DATA = ROOT / "data" / "curated" / "sample.csv"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+def _preload_heavy_modules():
+    """
+    Import the backtest entrypoints once so their import cost is paid
+    during configuration instead of while collecting individual modules.
+    """
+    import bt.api  # noqa: F401
+    import bt.logging.run_contract  # noqa: F401
+    import bt.logging.run_manifest  # noqa: F401
+    import bt.logging.summary  # noqa: F401
+
 def _ensure_pyarrow_parquet_attr():
     """
     Pandas' PyArrow parquet backend calls `pyarrow.parquet.*` via the
@@ -20,12 +32,24 @@ def _ensure_pyarrow_parquet_attr():
     import pyarrow.parquet as pq
     pa.parquet = pq  # force attach every time
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Rewrite stored artifact fingerprints under tests/_snapshots.",
+    )
+
 def pytest_configure(config):
     # Run as early as possible (before collection finishes / plugins run)
     try:
         _ensure_pyarrow_parquet_attr()
     except Exception:
         pass
+    try:
+        _preload_heavy_modules()
+    except ImportError:
+        pass
 
 @pytest.fixture(autouse=True)
 def _fix_pyarrow_parquet_attr():
@@ -35,3 +59,56 @@ def _fix_pyarrow_parquet_attr():
     except Exception:
         pass
     yield
+
+
+@pytest.fixture(scope="session")
+def coinflip_smoke_run(tmp_path_factory):
+    from bt.api import run_backtest
+
+    out_dir = tmp_path_factory.mktemp("coinflip_out", numbered=False)
+    return Path(
+        run_backtest(
+            config_path=str(ENGINE_CONFIG),
+            data_path=str(SAMPLE_DATA),
+            out_dir=str(out_dir),
+            run_name="coinflip_smoke",
+        )
+    )
+
+@pytest.fixture(scope="session")
+def volfloor_smoke_run(tmp_path_factory):
+    from bt.api import run_backtest
+    from tests.helpers.yaml_io import dump_yaml
+
+    htf_cfg = {
+        "initial_cash": 100000.0,
+        "max_leverage": 2.0,
+        "min_history_bars": 1,
+        "lookback_bars": 1,
+        "min_avg_volume": 0.0,
+        "lag_bars": 0,
+        "signal_delay_bars": 1,
+        "risk": {"mode": "r_fixed", "r_per_trade": 0.005},
+        "strategy": {
+            "name": "volfloor_donchian",
+            "timeframe": "1h",
+            "donchian_entry_lookback": 5,
+            "donchian_exit_lookback": 3,
+            "adx_min": 1.0,
+            "vol_floor_pct": 0.0,
+            "atr_period": 3,
+            "vol_lookback_bars": 5,
+        },
+        "htf_resampler": {"timeframes": ["1h"], "strict": True},
+    }
+    out_dir = tmp_path_factory.mktemp("volfloor_out", numbered=False)
+    cfg_path = out_dir / "engine_volfloor.yaml"
+    cfg_path.write_text(dump_yaml(htf_cfg), encoding="utf-8")
+    return Path(
+        run_backtest(
+            config_path=str(cfg_path),
+            data_path=str(SAMPLE_DATA),
+            out_dir=str(out_dir),
+            run_name="volfloor_smoke",
+        )
+    )
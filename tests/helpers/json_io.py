@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_canonical(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(payload, sort_keys=True, indent=2).encode("utf-8")
+
+
+def dumps_line(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True).encode("utf-8")
+
+
+def write_jsonl(path: Path, payloads: Iterable[Any]) -> None:
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        path.write_bytes(b"".join(orjson.dumps(payload, option=option) for payload in payloads))
+        return
+    lines = tuple(dumps_line(payload) for payload in payloads)
+    path.write_bytes(b"\n".join(lines) + b"\n" if lines else b"")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, payload: Any) -> None:
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        path.write_bytes(orjson.dumps(payload, default=str, option=option))
+        return
+    path.write_bytes((json.dumps(payload, sort_keys=True, indent=2, default=str) + "\n").encode("utf-8"))
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    with path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield loads(line)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+
+from pandas import Timestamp
+
+from bt.core.types import Bar
+from bt.risk.risk_engine import RiskEngine
+
+TS_FIXED = Timestamp("2024-01-01T00:00:00Z")
+BAR = Bar(ts=TS_FIXED, symbol="BTC", open=100.0, high=110.0, low=90.0, close=100.0, volume=1.0)
+
+
+def bar_at(ts: Timestamp) -> Bar:
+    if ts == TS_FIXED:
+        return BAR
+    return dataclasses.replace(BAR, ts=ts)
+
+
+@functools.lru_cache(maxsize=8)
+def cached_engine(stop_resolution: str = "strict", allow_legacy_proxy: bool = False) -> RiskEngine:
+    # RiskEngine only holds config-derived state, so one instance per mode can be shared across tests.
+    return RiskEngine(
+        max_positions=5,
+        config={
+            "risk": {
+                "mode": "r_fixed",
+                "r_per_trade": 0.01,
+                "qty_rounding": "none",
+                "stop": {},
+                "stop_resolution": stop_resolution,
+                "allow_legacy_proxy": allow_legacy_proxy,
+            }
+        },
+    )
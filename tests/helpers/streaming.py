@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+BAR_SCHEMA = pa.schema(
+    [
+        ("ts", pa.timestamp("ns", tz="UTC")),
+        *((name, pa.float64()) for name in OHLCV_COLUMNS),
+        ("symbol", pa.string()),
+    ]
+)
+PARTITIONED_PATH_TEMPLATE = "symbols/{symbol}/part-0.parquet"
+
+_PARQUET_OPTIONS = {"compression": "none", "write_statistics": False, "use_dictionary": False}
+
+
+def write_bars_parquet(path: Path, table: pa.Table) -> None:
+    # Fixture files are tiny; skipping compression and statistics keeps writes cheap.
+    pq.write_table(table, path, **_PARQUET_OPTIONS)
+
+
+def write_partitioned_bars(dataset_dir: Path, tables: Iterable[pa.Table], symbols: Iterable[str]) -> None:
+    """Write every symbol's bars with one partitioned dataset write under ``PARTITIONED_PATH_TEMPLATE``."""
+    symbols_dir = dataset_dir / "symbols"
+    table = pa.concat_tables(tables)
+    ds.write_dataset(
+        table,
+        base_dir=symbols_dir,
+        format="parquet",
+        partitioning=["symbol"],
+        basename_template="part-{i}.parquet",
+        preserve_order=True,
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(**_PARQUET_OPTIONS),
+    )
+
+    # Partitioned writes emit nothing for symbols without rows; stream sources still expect a file.
+    empty = table.schema.remove(table.schema.get_field_index("symbol")).empty_table()
+    for symbol in symbols:
+        symbol_path = dataset_dir / PARTITIONED_PATH_TEMPLATE.format(symbol=symbol)
+        if not symbol_path.exists():
+            symbol_path.parent.mkdir(parents=True, exist_ok=True)
+            write_bars_parquet(symbol_path, empty)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+
+def dump_yaml(payload: Any) -> str:
+    return yaml.dump(payload, Dumper=SafeDumper, sort_keys=False)
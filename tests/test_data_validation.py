@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from bt.core.types import Bar
@@ -173,3 +174,23 @@ def test_historical_data_feed_emits_bars_by_global_timestamp() -> None:
     assert {bar.ts for bar in third} == {t2}
 
     assert feed.next() is None
+
+
+def test_feed_from_arrow_matches_dataframe_feed() -> None:
+    t0 = pd.Timestamp("2020-01-01 00:00:00", tz="UTC")
+    t1 = pd.Timestamp("2020-01-01 00:01:00", tz="UTC")
+    df = _bars_df(
+        [
+            {"ts": t0, "symbol": "AAA", "open": 1.0, "high": 1.5, "low": 0.5, "close": 1.2, "volume": 10.0, "vwap": 1.1},
+            {"ts": t0, "symbol": "BBB", "open": 2.0, "high": 2.5, "low": 1.5, "close": 2.2, "volume": 20.0, "vwap": None},
+            {"ts": t1, "symbol": "AAA", "open": 1.1, "high": 1.6, "low": 0.6, "close": 1.3, "volume": 11.0, "vwap": 1.2},
+        ]
+    )
+
+    from_frame = HistoricalDataFeed(df)
+    from_arrow = HistoricalDataFeed.from_arrow(pa.Table.from_pandas(df, preserve_index=False))
+
+    assert from_arrow.symbols() == from_frame.symbols()
+    while (expected := from_frame.next()) is not None:
+        assert from_arrow.next() == expected
+    assert from_arrow.next() is None
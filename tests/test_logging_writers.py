@@ -97,6 +97,32 @@ def test_trades_csv_writer_writes_trade(tmp_path: Path) -> None:
     assert parsed["side"] == "BUY"
 
 
+def test_trades_csv_writer_defers_flush_until_close_when_unforced(tmp_path: Path) -> None:
+    path = tmp_path / "trades.csv"
+    writer = TradesCsvWriter(path, force_flush_after=None)
+    trade = Trade(
+        symbol="AAPL",
+        side=Side.BUY,
+        entry_ts=pd.Timestamp("2024-01-01T00:00:00", tz="UTC"),
+        exit_ts=pd.Timestamp("2024-01-01T01:00:00", tz="UTC"),
+        entry_price=100.0,
+        exit_price=110.0,
+        qty=2.0,
+        pnl=20.0,
+        fees=1.0,
+        slippage=0.5,
+        mae_price=None,
+        mfe_price=None,
+    )
+    writer.write_trade(trade)
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+    writer.close()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
 def test_trades_csv_writer_expands_dynamic_columns_rectangularly(tmp_path: Path) -> None:
     path = tmp_path / "trades.csv"
     writer = TradesCsvWriter(path)
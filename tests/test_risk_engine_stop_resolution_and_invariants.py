@@ -1,41 +1,20 @@
 from __future__ import annotations
 
-import pandas as pd
-
 from bt.core.enums import Side
-from bt.core.types import Bar, Signal
+from bt.core.types import Signal
 from bt.risk.risk_engine import RiskEngine
-
-
-def _bar(ts: pd.Timestamp) -> Bar:
-    return Bar(ts=ts, symbol="BTC", open=100.0, high=110.0, low=90.0, close=100.0, volume=1.0)
-
-
-def _engine(stop_resolution: str = "strict", allow_legacy_proxy: bool = False) -> RiskEngine:
-    return RiskEngine(
-        max_positions=5,
-        config={
-            "risk": {
-                "mode": "r_fixed",
-                "r_per_trade": 0.01,
-                "qty_rounding": "none",
-                "stop": {},
-                "stop_resolution": stop_resolution,
-                "allow_legacy_proxy": allow_legacy_proxy,
-            }
-        },
-    )
+from tests.helpers.stop_resolution import TS_FIXED, bar_at, cached_engine
 
 
 def test_allow_legacy_proxy_mode_approves_with_legacy_metadata() -> None:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    engine = _engine("safe", allow_legacy_proxy=True)
+    ts = TS_FIXED
+    engine = cached_engine("safe", allow_legacy_proxy=True)
     signal = Signal(ts=ts, symbol="BTC", side=Side.BUY, signal_type="unit", confidence=1.0, metadata={})
 
     order_intent, reason = engine.signal_to_order_intent(
         ts=ts,
         signal=signal,
-        bar=_bar(ts),
+        bar=bar_at(ts),
         equity=10_000.0,
         free_margin=10_000.0,
         open_positions=0,
@@ -51,8 +30,8 @@ def test_allow_legacy_proxy_mode_approves_with_legacy_metadata() -> None:
 
 
 def test_close_only_approves_and_uses_negative_current_qty() -> None:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    engine = _engine()
+    ts = TS_FIXED
+    engine = cached_engine()
     signal = Signal(
         ts=ts,
         symbol="BTC",
@@ -65,7 +44,7 @@ def test_close_only_approves_and_uses_negative_current_qty() -> None:
     order_intent, reason = engine.signal_to_order_intent(
         ts=ts,
         signal=signal,
-        bar=_bar(ts),
+        bar=bar_at(ts),
         equity=10_000.0,
         free_margin=0.0,
         open_positions=1,
@@ -88,39 +67,9 @@ def test_qty_sign_invariant_rejects_mismatched_order_qty() -> None:
     )
 
 
-def test_exit_signal_suffix_bypasses_stop_resolution_in_strict_mode() -> None:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    engine = _engine("strict")
-    signal = Signal(
-        ts=ts,
-        symbol="BTC",
-        side=Side.SELL,
-        signal_type="h1_volfloor_donchian_exit",
-        confidence=1.0,
-        metadata={},
-    )
-
-    order_intent, reason = engine.signal_to_order_intent(
-        ts=ts,
-        signal=signal,
-        bar=_bar(ts),
-        equity=10_000.0,
-        free_margin=0.0,
-        open_positions=1,
-        max_leverage=2.0,
-        current_qty=2.0,
-    )
-
-    assert order_intent is not None
-    assert reason == "risk_approved:close_only"
-    assert order_intent.qty == -2.0
-    assert order_intent.metadata["stop_resolution_skipped"] is True
-    assert order_intent.metadata["stop_resolution_skip_reason"] == "exit_signal"
-
-
 def test_exit_signal_suffix_can_still_be_rejected_when_already_flat() -> None:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    engine = _engine("strict")
+    ts = TS_FIXED
+    engine = cached_engine("strict")
     signal = Signal(
         ts=ts,
         symbol="BTC",
@@ -133,7 +82,7 @@ def test_exit_signal_suffix_can_still_be_rejected_when_already_flat() -> None:
     order_intent, reason = engine.signal_to_order_intent(
         ts=ts,
         signal=signal,
-        bar=_bar(ts),
+        bar=bar_at(ts),
         equity=10_000.0,
         free_margin=10_000.0,
         open_positions=0,
@@ -146,8 +95,8 @@ def test_exit_signal_suffix_can_still_be_rejected_when_already_flat() -> None:
 
 
 def test_entry_signal_without_stop_still_rejects_in_strict_mode() -> None:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    engine = _engine("strict")
+    ts = TS_FIXED
+    engine = cached_engine("strict")
     signal = Signal(ts=ts, symbol="BTC", side=Side.BUY, signal_type="unit", confidence=1.0, metadata={})
 
     import pytest
@@ -156,7 +105,7 @@ def test_entry_signal_without_stop_still_rejects_in_strict_mode() -> None:
         engine.signal_to_order_intent(
             ts=ts,
             signal=signal,
-            bar=_bar(ts),
+            bar=bar_at(ts),
             equity=10_000.0,
             free_margin=10_000.0,
             open_positions=0,
@@ -1,15 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-import sys
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_ROOT = PROJECT_ROOT / "src"
-if str(SRC_ROOT) not in sys.path:
-    sys.path.insert(0, str(SRC_ROOT))
-
 from bt.logging.run_contract import REQUIRED_ARTIFACTS, validate_run_artifacts
 
 
@@ -3,9 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import yaml
-
 from bt.api import run_backtest
+from tests.helpers.yaml_io import dump_yaml
 
 
 TIER3_PRESET = {
@@ -17,7 +16,7 @@ TIER3_PRESET = {
 }
 
 
-def _write_config(path: Path, *, execution: dict | None = None) -> None:
+def _dump_config(execution: dict | None = None) -> bytes:
     config: dict[str, object] = {
         "initial_cash": 100000.0,
         "max_leverage": 5.0,
@@ -28,23 +27,32 @@ def _write_config(path: Path, *, execution: dict | None = None) -> None:
     }
     if execution is not None:
         config["execution"] = execution
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    return dump_yaml(config).encode("utf-8")
+
+
+_DEFAULT_CFG = _dump_config()
+_TIER3_CFG = _dump_config({"profile": "tier3"})
+_TIER3_FIXED_SPREAD_CFG = _dump_config({"profile": "tier3", "spread_mode": "fixed_bps"})
+
+
+def _write_config(path: Path, *, execution: dict | None = None) -> None:
+    path.write_bytes(_dump_config(execution))
 
 
 def _load_run_status(run_dir: Path) -> dict[str, object]:
     return json.loads((run_dir / "run_status.json").read_text(encoding="utf-8"))
 
 
+_NONDETERMINISTIC_KEYS = frozenset({"run_id", "created_at", "timestamp", "started_at", "finished_at"})
+
+
 def _scrub_nondeterministic(payload: dict[str, object]) -> dict[str, object]:
-    scrubbed = dict(payload)
-    for key in ("run_id", "created_at", "timestamp", "started_at", "finished_at"):
-        scrubbed.pop(key, None)
-    return scrubbed
+    return {key: value for key, value in payload.items() if key not in _NONDETERMINISTIC_KEYS}
 
 
 def test_run_status_execution_metadata_appears_with_defaults(tmp_path: Path) -> None:
     config_path = tmp_path / "engine_defaults.yaml"
-    _write_config(config_path)
+    config_path.write_bytes(_DEFAULT_CFG)
 
     run_dir = Path(
         run_backtest(
@@ -68,7 +76,7 @@ def test_run_status_execution_metadata_appears_with_defaults(tmp_path: Path) ->
 
 def test_run_status_execution_metadata_matches_tier3_profile(tmp_path: Path) -> None:
     config_path = tmp_path / "engine_tier3.yaml"
-    _write_config(config_path, execution={"profile": "tier3"})
+    config_path.write_bytes(_TIER3_CFG)
 
     run_dir = Path(
         run_backtest(
@@ -117,7 +125,7 @@ def test_run_status_execution_metadata_with_fixed_bps_spread_includes_spread_bps
 
 def test_run_status_tier_fixed_spread_without_explicit_bps_uses_tier_value(tmp_path: Path) -> None:
     config_path = tmp_path / "engine_tier3_fixed_spread.yaml"
-    _write_config(config_path, execution={"profile": "tier3", "spread_mode": "fixed_bps"})
+    config_path.write_bytes(_TIER3_FIXED_SPREAD_CFG)
 
     run_dir = Path(
         run_backtest(
@@ -136,7 +144,7 @@ def test_run_status_tier_fixed_spread_without_explicit_bps_uses_tier_value(tmp_p
 
 def test_run_status_execution_metadata_is_deterministic(tmp_path: Path) -> None:
     config_path = tmp_path / "engine_deterministic.yaml"
-    _write_config(config_path, execution={"profile": "tier3"})
+    config_path.write_bytes(_TIER3_CFG)
 
     run_a = Path(
         run_backtest(
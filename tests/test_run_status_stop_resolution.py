@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pandas as pd
-import yaml
+import pytest
 
+import bt.strategy as strategy_module
 from bt.core.enums import Side
 from bt.core.types import Bar, Signal
 from bt.experiments.grid_runner import run_grid
 from bt.strategy.base import Strategy
+from tests.helpers.yaml_io import dump_yaml
 
 
 class _NoStopSignalStrategy(Strategy):
@@ -62,8 +65,10 @@ class _ExplicitStopSignalStrategy(Strategy):
         return signals
 
 
-def _write_dataset(dataset_dir: Path) -> Path:
-    dataset_dir.mkdir(parents=True, exist_ok=True)
+def _write_dataset(dataset_dir: Path) -> str:
+    base = os.fspath(dataset_dir)
+    os.makedirs(base, exist_ok=True)
+    bars_path = os.path.join(base, "bars.parquet")
     ts_index = pd.date_range("2024-01-01", periods=4, freq="min", tz="UTC")
     rows: list[dict[str, object]] = []
     for i, ts in enumerate(ts_index):
@@ -79,10 +84,10 @@ def _write_dataset(dataset_dir: Path) -> Path:
             }
         )
     bars = pd.DataFrame(rows)
-    bars.to_parquet(dataset_dir / "bars.parquet", index=False)
-    with (dataset_dir / "manifest.yaml").open("w", encoding="utf-8") as handle:
-        yaml.safe_dump({"version": 1, "format": "parquet", "files": ["bars.parquet"]}, handle, sort_keys=False)
-    return dataset_dir / "bars.parquet"
+    bars.to_parquet(bars_path, index=False)
+    with open(os.path.join(base, "manifest.yaml"), "w", encoding="utf-8") as handle:
+        handle.write(dump_yaml({"version": 1, "format": "parquet", "files": ["bars.parquet"]}))
+    return bars_path
 
 
 def _base_config(strategy_name: str) -> dict:
@@ -98,37 +103,35 @@ def _base_config(strategy_name: str) -> dict:
     }
 
 
-def _run_single(tmp_path: Path, *, strategy_name: str, out_name: str) -> dict:
-    import bt.strategy as strategy_module
-
-    strategy_module.STRATEGY_REGISTRY["test_no_stop_signal"] = _NoStopSignalStrategy
-    strategy_module.STRATEGY_REGISTRY["test_explicit_stop_signal"] = _ExplicitStopSignalStrategy
+def _run_single(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, strategy_name: str, out_name: str) -> dict:
+    monkeypatch.setitem(strategy_module.STRATEGY_REGISTRY, "test_no_stop_signal", _NoStopSignalStrategy)
+    monkeypatch.setitem(strategy_module.STRATEGY_REGISTRY, "test_explicit_stop_signal", _ExplicitStopSignalStrategy)
 
     exp = {"version": 1, "grid": {"strategy.seed": [1]}, "run_naming": {"template": "seed{strategy.seed}"}}
     out_path = tmp_path / out_name
     data_path = _write_dataset(tmp_path / f"{out_name}_dataset")
-    run_grid(config=_base_config(strategy_name), experiment_cfg=exp, data_path=str(data_path), out_path=out_path)
+    run_grid(config=_base_config(strategy_name), experiment_cfg=exp, data_path=data_path, out_path=out_path)
     status_path = out_path / "runs" / "run_001__seed1" / "run_status.json"
     return json.loads(status_path.read_text(encoding="utf-8"))
 
 
-def test_run_status_records_unresolved_when_no_stop(tmp_path: Path) -> None:
-    payload = _run_single(tmp_path, strategy_name="test_no_stop_signal", out_name="legacy")
+def test_run_status_records_unresolved_when_no_stop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = _run_single(tmp_path, monkeypatch, strategy_name="test_no_stop_signal", out_name="legacy")
     assert payload["stop_resolution"] == "unresolved"
     assert payload["used_legacy_stop_proxy"] is False
     assert payload["r_metrics_valid"] is False
 
 
-def test_run_status_records_explicit_stop(tmp_path: Path) -> None:
-    payload = _run_single(tmp_path, strategy_name="test_explicit_stop_signal", out_name="explicit")
+def test_run_status_records_explicit_stop(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = _run_single(tmp_path, monkeypatch, strategy_name="test_explicit_stop_signal", out_name="explicit")
     assert payload["stop_resolution"] == "explicit_stop_price"
     assert payload["used_legacy_stop_proxy"] is False
     assert payload["r_metrics_valid"] is True
 
 
-def test_run_status_new_keys_are_deterministic(tmp_path: Path) -> None:
-    payload_a = _run_single(tmp_path, strategy_name="test_explicit_stop_signal", out_name="determinism_a")
-    payload_b = _run_single(tmp_path, strategy_name="test_explicit_stop_signal", out_name="determinism_b")
+def test_run_status_new_keys_are_deterministic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    payload_a = _run_single(tmp_path, monkeypatch, strategy_name="test_explicit_stop_signal", out_name="determinism_a")
+    payload_b = _run_single(tmp_path, monkeypatch, strategy_name="test_explicit_stop_signal", out_name="determinism_b")
 
     keys = ["stop_resolution", "used_legacy_stop_proxy", "r_metrics_valid", "notes"]
     assert {key: payload_a[key] for key in keys} == {key: payload_b[key] for key in keys}
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 from pathlib import Path
-import sys
+from types import MappingProxyType
 from typing import Any
 
-import pandas as pd
-import yaml
-
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_ROOT = PROJECT_ROOT / "src"
-if str(SRC_ROOT) not in sys.path:
-    sys.path.insert(0, str(SRC_ROOT))
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
 
 from bt.api import run_backtest
 from bt.logging.run_contract import validate_run_artifacts
 from bt.logging.run_manifest import write_run_manifest
 from bt.logging.summary import write_summary_txt
+from tests.helpers.json_io import dumps_canonical, read_json, write_json
+from tests.helpers.yaml_io import dump_yaml
+
+SNAPSHOT_PATH = Path(__file__).resolve().parent / "_snapshots" / "presentation_contract.json"
+_RUN_STATUS_IGNORED_KEYS = frozenset(
+    {
+        "created_at_utc",
+        "created_at",
+        "generated_at",
+        "timestamp",
+        "started_at_utc",
+        "finished_at_utc",
+        "run_started_at_utc",
+        "run_finished_at_utc",
+    }
+)
 
 
 def _write_legacy_manifest(dataset_dir: Path, symbols: list[str]) -> None:
@@ -24,50 +37,56 @@ def _write_legacy_manifest(dataset_dir: Path, symbols: list[str]) -> None:
     (dataset_dir / "manifest.yaml").write_text(
         "format: per_symbol_parquet\n"
         f"symbols: [{', '.join(symbols)}]\n"
-        'path: "symbols/{symbol}.parquet"\n',
+        'path: "symbols/{symbol}/part-0.parquet"\n',
         encoding="utf-8",
     )
 
 
-def _write_symbol_parquet(
-    dataset_dir: Path,
-    symbol: str,
-    rows: list[tuple[str, float, float, float, float, float]],
-) -> None:
-    symbols_dir = dataset_dir / "symbols"
-    symbols_dir.mkdir(parents=True, exist_ok=True)
-    frame = pd.DataFrame(rows, columns=["ts", "open", "high", "low", "close", "volume"])
-    frame["ts"] = pd.to_datetime(frame["ts"], utc=True)
-    frame["symbol"] = symbol
-    frame.to_parquet(symbols_dir / f"{symbol}.parquet", index=False)
+def _symbol_table(symbol: str, rows: list[tuple[str, float, float, float, float, float]]) -> pa.Table:
+    ts, open_, high, low, close, volume = zip(*rows)
+    return pa.table(
+        {
+            "ts": pa.array(ts).cast(pa.timestamp("ns", tz="UTC")),
+            "open": pa.array(open_, type=pa.float64()),
+            "high": pa.array(high, type=pa.float64()),
+            "low": pa.array(low, type=pa.float64()),
+            "close": pa.array(close, type=pa.float64()),
+            "volume": pa.array(volume, type=pa.float64()),
+            "symbol": pa.array([symbol] * len(rows), type=pa.string()),
+        }
+    )
 
 
 def _write_dataset(dataset_dir: Path) -> None:
-    symbols = ["AAA", "BBB"]
-    _write_legacy_manifest(dataset_dir, symbols)
-
-    _write_symbol_parquet(
-        dataset_dir,
-        "AAA",
-        [
+    rows_by_symbol = {
+        "AAA": [
             ("2024-01-01T00:00:00Z", 100.0, 101.0, 99.0, 100.0, 1.0),
             ("2024-01-01T00:01:00Z", 101.0, 102.0, 100.0, 101.0, 1.1),
             ("2024-01-01T00:02:00Z", 102.0, 103.0, 101.0, 102.0, 1.2),
         ],
-    )
-    _write_symbol_parquet(
-        dataset_dir,
-        "BBB",
-        [
+        "BBB": [
             ("2024-01-01T00:00:00Z", 200.0, 201.0, 199.0, 200.0, 2.0),
             ("2024-01-01T00:01:00Z", 199.0, 200.0, 198.0, 199.0, 2.1),
             ("2024-01-01T00:02:00Z", 198.0, 199.0, 197.0, 198.0, 2.2),
         ],
+    }
+    _write_legacy_manifest(dataset_dir, list(rows_by_symbol))
+
+    # One partitioned write emits symbols/<symbol>/part-0.parquet for every symbol.
+    table = pa.concat_tables(_symbol_table(symbol, rows) for symbol, rows in rows_by_symbol.items())
+    ds.write_dataset(
+        table,
+        base_dir=dataset_dir / "symbols",
+        format="parquet",
+        partitioning=["symbol"],
+        basename_template="part-{i}.parquet",
+        preserve_order=True,
+        existing_data_behavior="overwrite_or_ignore",
     )
 
 
-def _write_config(path: Path, *, benchmark_enabled: bool = False) -> dict[str, Any]:
-    config: dict[str, Any] = {
+def _build_config(benchmark_enabled: bool) -> dict[str, Any]:
+    return {
         "initial_cash": 1000.0,
         "max_leverage": 2.0,
         "signal_delay_bars": 1,
@@ -89,38 +108,84 @@ def _write_config(path: Path, *, benchmark_enabled: bool = False) -> dict[str, A
             "initial_equity": 1000.0,
         },
     }
-    path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
-    return config
+
+
+_CONFIGS = {flag: MappingProxyType(_build_config(flag)) for flag in (False, True)}
+_CONFIG_YAML = {flag: dump_yaml(_build_config(flag)).encode("utf-8") for flag in (False, True)}
+
+
+def _write_config(path: Path, *, benchmark_enabled: bool = False) -> dict[str, Any]:
+    path.write_bytes(_CONFIG_YAML[benchmark_enabled])
+    # write_run_manifest only accepts a real dict, so hand back a shallow copy of the frozen config.
+    return dict(_CONFIGS[benchmark_enabled])
+
+
+@pytest.fixture(scope="session")
+def shared_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    dataset_dir = tmp_path_factory.mktemp("stage_f_dataset")
+    _write_dataset(dataset_dir)
+    return dataset_dir
 
 
 def _list_files(run_dir: Path) -> list[str]:
-    return sorted(path.name for path in run_dir.iterdir() if path.is_file())
+    with os.scandir(run_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.is_file())
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = read_json(path)
     assert isinstance(payload, dict)
     return payload
 
 
-def _canonicalize_json(d: dict[str, Any]) -> str:
-    return json.dumps(d, sort_keys=True, indent=2)
+def _canonicalize_json(d: dict[str, Any]) -> bytes:
+    return dumps_canonical(d)
 
 
 def _strip_generated_line(summary_text: str) -> str:
     return "\n".join(line for line in summary_text.splitlines() if not line.startswith("Generated:"))
 
 
+def _digest(path: Path) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb", buffering=0) as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _digest_bytes(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _artifact_fingerprint(run_dir: Path) -> dict[str, str]:
+    manifest = _normalize_run_manifest(_load_json(run_dir / "run_manifest.json"))
+    manifest.pop("data_path", None)
+    summary = _strip_generated_line((run_dir / "summary.txt").read_text(encoding="utf-8"))
+
+    fingerprint = {
+        "performance.json": _digest(run_dir / "performance.json"),
+        "run_manifest.json": _digest_bytes(_canonicalize_json(manifest)),
+        "summary.txt": _digest_bytes(summary.encode("utf-8")),
+        "equity.csv": _digest(run_dir / "equity.csv"),
+        "trades.csv": _digest(run_dir / "trades.csv"),
+    }
+    run_status_path = run_dir / "run_status.json"
+    if run_status_path.exists():
+        fingerprint["run_status.json"] = _digest_bytes(
+            _canonicalize_json(_normalize_run_status(_load_json(run_status_path)))
+        )
+    return dict(sorted(fingerprint.items()))
+
+
 def _run_contract_backtest(
     tmp_path: Path,
+    dataset_dir: Path,
     *,
     out_dir_name: str,
     run_name: str,
     benchmark_enabled: bool = False,
 ) -> tuple[Path, Path, dict[str, Any]]:
-    dataset_dir = tmp_path / "dataset"
-    _write_dataset(dataset_dir)
-
     config_path = tmp_path / "engine.yaml"
     config = _write_config(config_path, benchmark_enabled=benchmark_enabled)
 
@@ -139,26 +204,24 @@ def _run_contract_backtest(
 
 
 def _normalize_run_status(payload: dict[str, Any]) -> dict[str, Any]:
-    ignored = {
-        "created_at_utc",
-        "created_at",
-        "generated_at",
-        "timestamp",
-        "started_at_utc",
-        "finished_at_utc",
-        "run_started_at_utc",
-        "run_finished_at_utc",
-    }
-
-    def _norm(value: Any) -> Any:
-        if isinstance(value, dict):
-            return {k: _norm(v) for k, v in value.items() if k not in ignored}
-        if isinstance(value, list):
-            return [_norm(item) for item in value]
-        return value
-
-    normalized = _norm(payload)
-    assert isinstance(normalized, dict)
+    normalized: dict[str, Any] = {}
+    stack: list[tuple[Any, Any]] = [(payload, normalized)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            entries = ((key, value) for key, value in source.items() if key not in _RUN_STATUS_IGNORED_KEYS)
+        else:
+            entries = enumerate(source)
+        for key, value in entries:
+            if isinstance(value, dict):
+                child: Any = {}
+            elif isinstance(value, list):
+                child = [None] * len(value)
+            else:
+                target[key] = value
+                continue
+            target[key] = child
+            stack.append((value, child))
     return normalized
 
 
@@ -170,9 +233,10 @@ def _normalize_run_manifest(payload: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
-def test_run_folder_contains_required_artifacts_end_to_end(tmp_path: Path) -> None:
+def test_run_folder_contains_required_artifacts_end_to_end(tmp_path: Path, shared_dataset: Path) -> None:
     run_dir, _, _ = _run_contract_backtest(
         tmp_path,
+        shared_dataset,
         out_dir_name="out",
         run_name="presentation-contract",
     )
@@ -193,9 +257,10 @@ def test_run_folder_contains_required_artifacts_end_to_end(tmp_path: Path) -> No
     assert required_artifacts.issubset(actual_files)
 
 
-def test_run_manifest_lists_run_dir_files(tmp_path: Path) -> None:
+def test_run_manifest_lists_run_dir_files(tmp_path: Path, shared_dataset: Path) -> None:
     run_dir, dataset_dir, config = _run_contract_backtest(
         tmp_path,
+        shared_dataset,
         out_dir_name="out",
         run_name="presentation-contract-manifest",
     )
@@ -210,9 +275,10 @@ def test_run_manifest_lists_run_dir_files(tmp_path: Path) -> None:
     assert manifest["benchmark_enabled"] is bool(config["benchmark"]["enabled"])
 
 
-def test_summary_contains_sections(tmp_path: Path) -> None:
+def test_summary_contains_sections(tmp_path: Path, shared_dataset: Path) -> None:
     run_dir, _, _ = _run_contract_backtest(
         tmp_path,
+        shared_dataset,
         out_dir_name="out",
         run_name="presentation-contract-summary",
     )
@@ -226,53 +292,34 @@ def test_summary_contains_sections(tmp_path: Path) -> None:
     assert "MOST IMPORTANT CONCLUSION" in summary
 
 
-def test_repeat_run_deterministic_artifacts(tmp_path: Path) -> None:
-    dataset_dir = tmp_path / "dataset"
-    _write_dataset(dataset_dir)
-
-    config_path = tmp_path / "engine.yaml"
-    config = _write_config(config_path, benchmark_enabled=False)
+def test_repeat_run_deterministic_artifacts(
+    tmp_path: Path,
+    shared_dataset: Path,
+    request: pytest.FixtureRequest,
+) -> None:
+    update_snapshots = bool(request.config.getoption("--update-snapshots", default=False))
 
-    run_dir_1 = Path(
-        run_backtest(
-            config_path=str(config_path),
-            data_path=str(dataset_dir),
-            out_dir=str(tmp_path / "out_1"),
-            run_name="presentation-contract-repeat",
-        )
-    )
-    run_dir_2 = Path(
-        run_backtest(
-            config_path=str(config_path),
-            data_path=str(dataset_dir),
-            out_dir=str(tmp_path / "out_2"),
-            run_name="presentation-contract-repeat",
-        )
+    run_dir_1, _, _ = _run_contract_backtest(
+        tmp_path,
+        shared_dataset,
+        out_dir_name="out_1",
+        run_name="presentation-contract-repeat",
     )
+    fingerprint_1 = _artifact_fingerprint(run_dir_1)
 
-    validate_run_artifacts(run_dir_1)
-    validate_run_artifacts(run_dir_2)
-    write_summary_txt(run_dir_1)
-    write_summary_txt(run_dir_2)
-    write_run_manifest(run_dir_1, config=config, data_path=str(dataset_dir))
-    write_run_manifest(run_dir_2, config=config, data_path=str(dataset_dir))
-
-    assert (run_dir_1 / "performance.json").read_bytes() == (run_dir_2 / "performance.json").read_bytes()
-
-    run_status_1 = run_dir_1 / "run_status.json"
-    run_status_2 = run_dir_2 / "run_status.json"
-    if run_status_1.exists() and run_status_2.exists():
-        normalized_1 = _normalize_run_status(_load_json(run_status_1))
-        normalized_2 = _normalize_run_status(_load_json(run_status_2))
-        assert _canonicalize_json(normalized_1) == _canonicalize_json(normalized_2)
-
-    manifest_1 = _normalize_run_manifest(_load_json(run_dir_1 / "run_manifest.json"))
-    manifest_2 = _normalize_run_manifest(_load_json(run_dir_2 / "run_manifest.json"))
-    assert _canonicalize_json(manifest_1) == _canonicalize_json(manifest_2)
+    if SNAPSHOT_PATH.exists() and not update_snapshots:
+        assert fingerprint_1 == _load_json(SNAPSHOT_PATH), (
+            f"Artifacts drifted from {SNAPSHOT_PATH.name}; rerun with --update-snapshots if the change is intended."
+        )
+        return
 
-    summary_1 = _strip_generated_line((run_dir_1 / "summary.txt").read_text(encoding="utf-8"))
-    summary_2 = _strip_generated_line((run_dir_2 / "summary.txt").read_text(encoding="utf-8"))
-    assert summary_1 == summary_2
+    run_dir_2, _, _ = _run_contract_backtest(
+        tmp_path,
+        shared_dataset,
+        out_dir_name="out_2",
+        run_name="presentation-contract-repeat",
+    )
+    assert fingerprint_1 == _artifact_fingerprint(run_dir_2)
 
-    assert (run_dir_1 / "equity.csv").read_bytes() == (run_dir_2 / "equity.csv").read_bytes()
-    assert (run_dir_1 / "trades.csv").read_bytes() == (run_dir_2 / "trades.csv").read_bytes()
+    SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_json(SNAPSHOT_PATH, fingerprint_1)
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from bt.experiments.grid_runner import _write_run_status
 from bt.logging.summary import write_summary_txt
 from bt.risk.stop_contract_reporting import build_stop_contract_report
-
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+from tests.helpers.json_io import iter_jsonl, read_json, write_json, write_jsonl
 
 
 def _write_required_summary_artifacts(run_dir: Path) -> None:
-    _write_json(
+    write_json(
         run_dir / "performance.json",
         {
             "net_pnl": 1.0,
@@ -61,7 +57,8 @@ def test_build_stop_contract_report_counts_deterministically(tmp_path: Path) ->
         {"reason_code": "risk_reject:stop_missing"},
         {"reason": "AAA: StrategyContractError: missing stop for entry sizing in strict mode"},
     ]
-    decisions_path.write_text("\n".join(json.dumps(line, sort_keys=True) for line in lines) + "\n", encoding="utf-8")
+    write_jsonl(decisions_path, lines)
+    assert list(iter_jsonl(decisions_path)) == lines
 
     report = build_stop_contract_report(
         config={"risk": {"stop_resolution": "strict", "allow_legacy_proxy": False}},
@@ -90,7 +87,7 @@ def test_write_run_status_includes_stop_contract_schema(tmp_path: Path) -> None:
     run_dir = tmp_path / "run"
     run_dir.mkdir()
     decisions_path = run_dir / "decisions.jsonl"
-    decisions_path.write_text(json.dumps({"order": {"metadata": {"stop_source": "explicit_stop_price"}}}) + "\n", encoding="utf-8")
+    write_jsonl(decisions_path, [{"order": {"metadata": {"stop_source": "explicit_stop_price"}}}])
 
     _write_run_status(
         run_dir,
@@ -104,7 +101,7 @@ def test_write_run_status_includes_stop_contract_schema(tmp_path: Path) -> None:
         config={"risk": {"stop_resolution": "safe", "allow_legacy_proxy": True}},
     )
 
-    payload = json.loads((run_dir / "run_status.json").read_text(encoding="utf-8"))
+    payload = read_json(run_dir / "run_status.json")
     assert payload["stop_contract"]["version"] == 1
     assert payload["stop_contract"]["mode"] == "safe"
     expected_count_keys = {
@@ -124,7 +121,7 @@ def test_summary_includes_stop_contract_block(tmp_path: Path) -> None:
     run_dir = tmp_path / "run_summary"
     run_dir.mkdir()
     _write_required_summary_artifacts(run_dir)
-    _write_json(
+    write_json(
         run_dir / "run_status.json",
         {
             "status": "PASS",
@@ -1,26 +1,52 @@
 from __future__ import annotations
 
+import functools
 import json
 
-import pandas as pd
 import pytest
+from pandas import Timestamp
 
 from bt.core.enums import Side
 from bt.core.types import Bar, Signal
 from bt.risk.reject_codes import RISK_FALLBACK_LEGACY_PROXY
 from bt.risk.risk_engine import RiskEngine
+from tests.helpers.json_io import dumps_line
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# msgspec is fastest for these small payloads; dumps_line covers orjson and the stdlib fallback.
+_encode_canonical = msgspec.json.Encoder(order="sorted").encode if msgspec is not None else dumps_line
+
+
+_TS_FIXED = Timestamp("2024-01-01T00:00:00Z")
+_BAR = Bar(ts=_TS_FIXED, symbol="BTC", open=100.0, high=106.0, low=95.0, close=100.0, volume=1.0)
 
 
 def _bar() -> Bar:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    return Bar(ts=ts, symbol="BTC", open=100.0, high=106.0, low=95.0, close=100.0, volume=1.0)
+    return _BAR
+
+
+@functools.lru_cache(maxsize=16)
+def _signal_cached(metadata_key: str) -> Signal:
+    return Signal(
+        ts=_TS_FIXED,
+        symbol="BTC",
+        side=Side.BUY,
+        signal_type="entry",
+        confidence=1.0,
+        metadata=json.loads(metadata_key),
+    )
 
 
 def _signal(*, metadata: dict | None = None) -> Signal:
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    return Signal(ts=ts, symbol="BTC", side=Side.BUY, signal_type="entry", confidence=1.0, metadata=metadata or {})
+    # RiskEngine copies signal.metadata before annotating it, so cached signals can be shared.
+    return _signal_cached(json.dumps(metadata or {}, sort_keys=True))
 
 
+@functools.lru_cache(maxsize=8)
 def _engine(*, stop_resolution: str, allow_legacy_proxy: bool) -> RiskEngine:
     return RiskEngine(
         max_positions=3,
@@ -114,14 +140,9 @@ def test_metadata_sequence_is_deterministic_for_identical_inputs() -> None:
     second_order, _ = _run(engine, _signal())
     assert first_order is not None and second_order is not None
 
-    def canonicalize(metadata: dict) -> str:
-        rounded: dict[str, object] = {}
-        for key in sorted(metadata):
-            value = metadata[key]
-            if isinstance(value, float):
-                rounded[key] = round(value, 8)
-            else:
-                rounded[key] = value
-        return json.dumps(rounded, sort_keys=True, separators=(",", ":"))
+    def canonicalize(metadata: dict) -> bytes:
+        return _encode_canonical(
+            {key: round(value, 8) if isinstance(value, float) else value for key, value in sorted(metadata.items())}
+        )
 
     assert canonicalize(first_order.metadata) == canonicalize(second_order.metadata)
@@ -10,20 +10,25 @@ from bt.risk.stop_distance import resolve_stop_distance
 from bt.risk.stop_resolver import resolve_stop_from_spec
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BarStub:
     high: float
     low: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IndicatorStub:
     is_ready: bool
     value: float | None
 
 
-def test_resolve_stop_from_spec_explicit_parity() -> None:
-    bar = BarStub(high=105.0, low=95.0)
+@pytest.fixture(scope="module")
+def default_bar() -> BarStub:
+    return BarStub(high=105.0, low=95.0)
+
+
+def test_resolve_stop_from_spec_explicit_parity(default_bar: BarStub) -> None:
+    bar = default_bar
     spec = StopSpec(kind="explicit", stop_price=95.0)
     config: dict[str, dict[str, dict[str, float | str]]] = {}
 
@@ -52,8 +57,8 @@ def test_resolve_stop_from_spec_explicit_parity() -> None:
     assert adapter_result.reason_code == "resolved:explicit"
 
 
-def test_resolve_stop_from_spec_atr_parity() -> None:
-    bar = BarStub(high=105.0, low=95.0)
+def test_resolve_stop_from_spec_atr_parity(default_bar: BarStub) -> None:
+    bar = default_bar
     spec = StopSpec(kind="atr", atr_multiple=2.0)
     ctx = {"indicators": {"AAPL": {"atr": IndicatorStub(is_ready=True, value=1.5)}}}
 
@@ -82,28 +87,28 @@ def test_resolve_stop_from_spec_atr_parity() -> None:
     assert adapter_result.reason_code == "resolved:atr"
 
 
-def test_resolve_stop_from_spec_legacy_proxy_for_invalid_stopspec_raises() -> None:
+def test_resolve_stop_from_spec_legacy_proxy_for_invalid_stopspec_raises(default_bar: BarStub) -> None:
     with pytest.raises(ValueError, match="missing required field 'stop_price'"):
         resolve_stop_from_spec(
             StopSpec(kind="explicit", stop_price=None),
             symbol="AAPL",
             side="long",
             entry_price=100.0,
-            bar=BarStub(high=105.0, low=95.0),
+            bar=default_bar,
             ctx={},
             config={"risk": {"stop": {"mode": "legacy_proxy"}}},
         )
 
 
 @pytest.mark.parametrize("policy", ["wider", "tighter"])
-def test_resolve_stop_from_spec_hybrid_not_implemented(policy: str) -> None:
+def test_resolve_stop_from_spec_hybrid_not_implemented(policy: str, default_bar: BarStub) -> None:
     with pytest.raises(NotImplementedError, match="kind='hybrid'"):
         resolve_stop_from_spec(
             StopSpec(kind="hybrid", stop_price=95.0, atr_multiple=2.0, hybrid_policy=policy),
             symbol="AAPL",
             side="long",
             entry_price=100.0,
-            bar=BarStub(high=105.0, low=95.0),
+            bar=default_bar,
             ctx={"indicators": {"AAPL": {"atr": IndicatorStub(is_ready=True, value=1.0)}}},
             config={"risk": {"hybrid_policy": policy}},
         )
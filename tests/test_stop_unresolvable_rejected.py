@@ -7,19 +7,59 @@ from bt.core.enums import Side
 from bt.core.types import Bar, Signal
 from bt.risk.risk_engine import RiskEngine
 
+TS = pd.Timestamp("2024-01-01T00:00:00Z")
 
-def test_stop_unresolvable_signal_is_rejected() -> None:
+
+@pytest.fixture(scope="module")
+def bar() -> Bar:
+    return Bar(ts=TS, symbol="BTC", open=100.0, high=110.0, low=100.0, close=105.0, volume=1.0)
+
+
+@pytest.fixture(scope="module")
+def signal() -> Signal:
+    return Signal(ts=TS, symbol="BTC", side=Side.BUY, signal_type="unit", confidence=1.0, metadata={})
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(
+            (
+                {"stop_resolution": "strict", "allow_legacy_proxy": False},
+                r"StrategyContractError",
+                ("signal_type=unit", "stop_price"),
+            ),
+            id="strict",
+        ),
+        pytest.param(
+            (
+                {"stop_resolution": "safe", "allow_legacy_proxy": False},
+                r"Safe mode is active but legacy proxy fallback is disabled",
+                ("risk.allow_legacy_proxy: true",),
+            ),
+            id="safe_without_legacy_proxy",
+        ),
+    ],
+)
+def engine_case(request: pytest.FixtureRequest) -> tuple[RiskEngine, str, tuple[str, ...]]:
+    cfg_overrides, expected_match, expected_fragments = request.param
     engine = RiskEngine(
         max_positions=5,
-                config={"risk": {"mode": "r_fixed", "r_per_trade": 0.01, "qty_rounding": "none", "stop": {}, "stop_resolution": "strict", "allow_legacy_proxy": False}},
+        config={"risk": {"mode": "r_fixed", "r_per_trade": 0.01, "qty_rounding": "none", "stop": {}, **cfg_overrides}},
     )
-    ts = pd.Timestamp("2024-01-01T00:00:00Z")
-    bar = Bar(ts=ts, symbol="BTC", open=100.0, high=110.0, low=100.0, close=105.0, volume=1.0)
-    signal = Signal(ts=ts, symbol="BTC", side=Side.BUY, signal_type="unit", confidence=1.0, metadata={})
+    return engine, expected_match, expected_fragments
+
+
+def test_stop_unresolvable_signal_is_rejected(
+    bar: Bar,
+    signal: Signal,
+    engine_case: tuple[RiskEngine, str, tuple[str, ...]],
+) -> None:
+    engine, expected_match, expected_fragments = engine_case
 
-    with pytest.raises(ValueError, match=r"StrategyContractError") as excinfo:
+    with pytest.raises(ValueError, match=expected_match) as excinfo:
         engine.signal_to_order_intent(
-            ts=ts,
+            ts=TS,
             signal=signal,
             bar=bar,
             equity=10_000.0,
@@ -30,5 +70,5 @@ def test_stop_unresolvable_signal_is_rejected() -> None:
         )
 
     reason = str(excinfo.value)
-    assert "signal_type=unit" in reason
-    assert "stop_price" in reason
+    for fragment in expected_fragments:
+        assert fragment in reason
@@ -1,27 +1,26 @@
 """Tests for the coinflip strategy."""
 from __future__ import annotations
 
+import dataclasses
+
 import pandas as pd
 
 from bt.core.enums import Side
 from bt.core.types import Bar
 from bt.strategy.coinflip import CoinFlipStrategy
 
+TS0 = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
+TS1 = TS0 + pd.Timedelta(minutes=1)
+TS2 = TS0 + pd.Timedelta(minutes=2)
+_PROTO_BAR = Bar(ts=TS0, symbol="A", open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0)
+
 
 def _bar(ts: pd.Timestamp, symbol: str) -> Bar:
-    return Bar(
-        ts=ts,
-        symbol=symbol,
-        open=1.0,
-        high=1.0,
-        low=1.0,
-        close=1.0,
-        volume=1.0,
-    )
+    return dataclasses.replace(_PROTO_BAR, ts=ts, symbol=symbol)
 
 
 def test_coinflip_emits_for_all_symbols_when_always_trade() -> None:
-    ts = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
+    ts = TS0
     bars_by_symbol = {
         "A": _bar(ts, "A"),
         "B": _bar(ts, "B"),
@@ -44,7 +43,7 @@ def test_coinflip_emits_for_all_symbols_when_always_trade() -> None:
 
 
 def test_coinflip_emits_none_when_never_trade() -> None:
-    ts = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
+    ts = TS0
     bars_by_symbol = {"A": _bar(ts, "A"), "B": _bar(ts, "B")}
     tradeable = {"A", "B"}
     strat = CoinFlipStrategy(seed=123, p_trade=0.0, cooldown_bars=0)
@@ -55,18 +54,15 @@ def test_coinflip_emits_none_when_never_trade() -> None:
 
 
 def test_coinflip_cooldown_enforces_spacing() -> None:
-    ts0 = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
-    ts1 = pd.Timestamp("2024-01-01 00:01:00", tz="UTC")
-    ts2 = pd.Timestamp("2024-01-01 00:02:00", tz="UTC")
-    bars_by_symbol_0 = {"A": _bar(ts0, "A")}
-    bars_by_symbol_1 = {"A": _bar(ts1, "A")}
-    bars_by_symbol_2 = {"A": _bar(ts2, "A")}
+    bars_by_symbol_0 = {"A": _bar(TS0, "A")}
+    bars_by_symbol_1 = {"A": _bar(TS1, "A")}
+    bars_by_symbol_2 = {"A": _bar(TS2, "A")}
     tradeable = {"A"}
     strat = CoinFlipStrategy(seed=123, p_trade=1.0, cooldown_bars=2)
 
-    signals_0 = strat.on_bars(ts0, bars_by_symbol_0, tradeable, {})
-    signals_1 = strat.on_bars(ts1, bars_by_symbol_1, tradeable, {})
-    signals_2 = strat.on_bars(ts2, bars_by_symbol_2, tradeable, {})
+    signals_0 = strat.on_bars(TS0, bars_by_symbol_0, tradeable, {})
+    signals_1 = strat.on_bars(TS1, bars_by_symbol_1, tradeable, {})
+    signals_2 = strat.on_bars(TS2, bars_by_symbol_2, tradeable, {})
 
     assert len(signals_0) == 1
     assert len(signals_1) == 0
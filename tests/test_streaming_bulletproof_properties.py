@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+import functools
+import itertools
+import operator
 from pathlib import Path
+import shutil
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
+import pytest
 
 from bt.data.load_feed import load_feed
+from tests.helpers.streaming import BAR_SCHEMA, OHLCV_COLUMNS, PARTITIONED_PATH_TEMPLATE, write_partitioned_bars
+
+_OHLCV_GETTER = operator.attrgetter(*OHLCV_COLUMNS)
 
 
 def _utc_ts(seconds: int) -> datetime:
@@ -19,30 +27,78 @@ def _write_manifest(dataset_dir: Path, symbols: list[str]) -> None:
     (dataset_dir / "manifest.yaml").write_text(
         "format: per_symbol_parquet\n"
         f"symbols: [{', '.join(symbols)}]\n"
-        'path: "symbols/{symbol}.parquet"\n',
+        f'path: "{PARTITIONED_PATH_TEMPLATE}"\n',
         encoding="utf-8",
     )
 
 
-def _write_symbol_parquet(dataset_dir: Path, symbol: str, rows: list[dict[str, Any]]) -> None:
-    symbols_dir = dataset_dir / "symbols"
-    symbols_dir.mkdir(parents=True, exist_ok=True)
-    frame = pd.DataFrame(rows)
-    if not frame.empty:
-        frame["ts"] = pd.to_datetime(frame["ts"], utc=True)
-        frame["symbol"] = symbol
-    else:
-        frame = pd.DataFrame(columns=["ts", "open", "high", "low", "close", "volume", "symbol"])
+def _symbol_table(symbol: str, rows: list[dict[str, Any]]) -> pa.Table:
+    return pa.Table.from_arrays(
+        [
+            pa.array([row["ts"] for row in rows], type=pa.timestamp("ns", tz="UTC")),
+            *(pa.array([row[name] for row in rows], type=pa.float64()) for name in OHLCV_COLUMNS),
+            pa.array([symbol] * len(rows), type=pa.string()),
+        ],
+        schema=BAR_SCHEMA,
+    )
+
 
-    table = pa.Table.from_pandas(frame, preserve_index=False)
-    pq.write_table(table, symbols_dir / f"{symbol}.parquet")
+_DATASETS: dict[str, dict[str, list[dict[str, Any]]]] = {
+    "no_lookahead": {
+        "AAA": [
+            {"ts": _utc_ts(0), "open": 10, "high": 11, "low": 9, "close": 10.5, "volume": 100},
+            {"ts": _utc_ts(100), "open": 11, "high": 12, "low": 10, "close": 11.5, "volume": 101},
+        ],
+        "BBB": [
+            {"ts": _utc_ts(50), "open": 20, "high": 21, "low": 19, "close": 20.5, "volume": 200},
+        ],
+    },
+    "gap": {
+        "AAA": [
+            {"ts": _utc_ts(0), "open": 10, "high": 11, "low": 9, "close": 10.5, "volume": 100},
+            {"ts": _utc_ts(120), "open": 12, "high": 13, "low": 11, "close": 12.5, "volume": 102},
+        ],
+        "BBB": [
+            {"ts": _utc_ts(0), "open": 20, "high": 21, "low": 19, "close": 20.5, "volume": 200},
+            {"ts": _utc_ts(60), "open": 21, "high": 22, "low": 20, "close": 21.5, "volume": 201},
+            {"ts": _utc_ts(120), "open": 22, "high": 23, "low": 21, "close": 22.5, "volume": 202},
+        ],
+    },
+    "deterministic": {
+        "AAA": [
+            {"ts": _utc_ts(0), "open": 1.0000000001, "high": 1.2, "low": 0.9, "close": 1.1, "volume": 10},
+            {"ts": _utc_ts(120), "open": 2.0, "high": 2.2, "low": 1.9, "close": 2.1, "volume": 12},
+        ],
+        "BBB": [
+            {"ts": _utc_ts(0), "open": 3.0, "high": 3.2, "low": 2.9, "close": 3.1, "volume": 20},
+            {"ts": _utc_ts(60), "open": 4.0, "high": 4.2, "low": 3.9, "close": 4.1, "volume": 21},
+            {"ts": _utc_ts(120), "open": 5.0, "high": 5.2, "low": 4.9, "close": 5.1, "volume": 22},
+        ],
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def datasets_cache(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    cache: dict[str, Path] = {}
+    for name, rows_by_symbol in _DATASETS.items():
+        dataset_dir = tmp_path_factory.mktemp(f"bulletproof_{name}")
+        _write_manifest(dataset_dir, list(rows_by_symbol))
+        write_partitioned_bars(
+            dataset_dir,
+            (_symbol_table(symbol, rows) for symbol, rows in rows_by_symbol.items()),
+            rows_by_symbol,
+        )
+        cache[name] = dataset_dir
+    return cache
 
 
 def _iterate_ticks(feed: Any):
     if hasattr(feed, "peek_time") and hasattr(feed, "next"):
-        while feed.peek_time() is not None:
-            ts = feed.peek_time()
-            bars = feed.next()
+        peek = feed.peek_time
+        nxt = feed.next
+        while (ts := peek()) is not None:
+            bars = nxt()
             if bars is None:
                 break
             yield ts, bars
@@ -61,42 +117,28 @@ def _iterate_ticks(feed: Any):
         yield ts, bars
 
 
+@functools.lru_cache(maxsize=None)
+def _iso(ts_ns: int) -> str:
+    return pd.Timestamp(ts_ns, unit="ns", tz="UTC").isoformat()
+
+
 def _collect_sequence(feed: Any) -> list[tuple[str, tuple[str, ...], tuple[tuple[str, float, float, float, float, float], ...]]]:
     out = []
     for ts, bars in _iterate_ticks(feed):
         keys = tuple(sorted(bars.keys()))
-        values = tuple(
-            (
-                symbol,
-                round(float(bars[symbol].open), 10),
-                round(float(bars[symbol].high), 10),
-                round(float(bars[symbol].low), 10),
-                round(float(bars[symbol].close), 10),
-                round(float(bars[symbol].volume), 10),
-            )
-            for symbol in keys
-        )
-        out.append((pd.Timestamp(ts).isoformat(), keys, values))
+        ohlcv = np.fromiter(
+            itertools.chain.from_iterable(_OHLCV_GETTER(bars[symbol]) for symbol in keys),
+            dtype=np.float64,
+            count=len(keys) * len(OHLCV_COLUMNS),
+        ).reshape(len(keys), len(OHLCV_COLUMNS))
+        rounded = np.round(ohlcv, 10).tolist()
+        values = tuple((symbol, *row) for symbol, row in zip(keys, rounded))
+        out.append((_iso(ts.value), keys, values))
     return out
 
 
-def test_emit_only_from_buffered_rows_no_lookahead(tmp_path: Path) -> None:
-    _write_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            {"ts": _utc_ts(0), "open": 10, "high": 11, "low": 9, "close": 10.5, "volume": 100},
-            {"ts": _utc_ts(100), "open": 11, "high": 12, "low": 10, "close": 11.5, "volume": 101},
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            {"ts": _utc_ts(50), "open": 20, "high": 21, "low": 19, "close": 20.5, "volume": 200},
-        ],
-    )
+def test_emit_only_from_buffered_rows_no_lookahead(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["no_lookahead"], tmp_path, dirs_exist_ok=True)
 
     feed = load_feed(str(tmp_path), config={})
     ticks = list(_iterate_ticks(feed))
@@ -106,25 +148,8 @@ def test_emit_only_from_buffered_rows_no_lookahead(tmp_path: Path) -> None:
     assert emitted_ts.index(_utc_ts(100)) > emitted_ts.index(_utc_ts(50))
 
 
-def test_missing_bars_not_filled_across_symbols(tmp_path: Path) -> None:
-    _write_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            {"ts": _utc_ts(0), "open": 10, "high": 11, "low": 9, "close": 10.5, "volume": 100},
-            {"ts": _utc_ts(120), "open": 12, "high": 13, "low": 11, "close": 12.5, "volume": 102},
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            {"ts": _utc_ts(0), "open": 20, "high": 21, "low": 19, "close": 20.5, "volume": 200},
-            {"ts": _utc_ts(60), "open": 21, "high": 22, "low": 20, "close": 21.5, "volume": 201},
-            {"ts": _utc_ts(120), "open": 22, "high": 23, "low": 21, "close": 22.5, "volume": 202},
-        ],
-    )
+def test_missing_bars_not_filled_across_symbols(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["gap"], tmp_path, dirs_exist_ok=True)
 
     feed = load_feed(str(tmp_path), config={})
     ticks = list(_iterate_ticks(feed))
@@ -136,25 +161,8 @@ def test_missing_bars_not_filled_across_symbols(tmp_path: Path) -> None:
     assert set(ticks[2][1].keys()) == {"AAA", "BBB"}
 
 
-def test_repeat_run_same_output_sequence(tmp_path: Path) -> None:
-    _write_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            {"ts": _utc_ts(0), "open": 1.0000000001, "high": 1.2, "low": 0.9, "close": 1.1, "volume": 10},
-            {"ts": _utc_ts(120), "open": 2.0, "high": 2.2, "low": 1.9, "close": 2.1, "volume": 12},
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            {"ts": _utc_ts(0), "open": 3.0, "high": 3.2, "low": 2.9, "close": 3.1, "volume": 20},
-            {"ts": _utc_ts(60), "open": 4.0, "high": 4.2, "low": 3.9, "close": 4.1, "volume": 21},
-            {"ts": _utc_ts(120), "open": 5.0, "high": 5.2, "low": 4.9, "close": 5.1, "volume": 22},
-        ],
-    )
+def test_repeat_run_same_output_sequence(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["deterministic"], tmp_path, dirs_exist_ok=True)
 
     feed1 = load_feed(str(tmp_path), config={})
     sequence1 = _collect_sequence(feed1)
@@ -1,116 +1,144 @@
 from __future__ import annotations
 
+import operator
 from pathlib import Path
+import shutil
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 
-from bt.data.dataset import load_dataset_manifest
+from bt.data.dataset import DatasetManifest, load_dataset_manifest
 from bt.data.stream_feed import StreamingHistoricalDataFeed
+from tests.helpers.streaming import BAR_SCHEMA, OHLCV_COLUMNS, PARTITIONED_PATH_TEMPLATE, write_partitioned_bars
+
+TS0 = pd.Timestamp("2024-01-01T00:00:00Z")
+TS1 = TS0 + pd.Timedelta(minutes=1)
+TS2 = TS0 + pd.Timedelta(minutes=2)
+_OHLCV_GETTER = operator.attrgetter(*OHLCV_COLUMNS)
 
 
 def _write_legacy_manifest(dataset_dir: Path, symbols: list[str]) -> None:
     manifest = (
         "format: per_symbol_parquet\n"
         f"symbols: [{', '.join(symbols)}]\n"
-        'path: "symbols/{symbol}.parquet"\n'
+        f'path: "{PARTITIONED_PATH_TEMPLATE}"\n'
     )
     (dataset_dir / "manifest.yaml").write_text(manifest, encoding="utf-8")
 
 
-def _write_symbol_parquet(dataset_dir: Path, symbol: str, rows: list[tuple[str, float, float, float, float, float]]) -> None:
-    symbols_dir = dataset_dir / "symbols"
-    symbols_dir.mkdir(parents=True, exist_ok=True)
-    frame = pd.DataFrame(
-        rows,
-        columns=["ts", "open", "high", "low", "close", "volume"],
+def _symbol_table(symbol: str, rows: list[tuple[str, float, float, float, float, float]]) -> pa.Table:
+    ts, *ohlcv = zip(*rows) if rows else [()] * 6
+    return pa.Table.from_arrays(
+        [
+            pa.array(ts, type=pa.string()).cast(pa.timestamp("ns", tz="UTC")),
+            *(pa.array(values, type=pa.float64()) for values in ohlcv),
+            pa.array([symbol] * len(rows), type=pa.string()),
+        ],
+        schema=BAR_SCHEMA,
     )
-    if not frame.empty:
-        frame["ts"] = pd.to_datetime(frame["ts"], utc=True)
-        frame["symbol"] = symbol
-    else:
-        frame = pd.DataFrame(columns=["ts", "open", "high", "low", "close", "volume", "symbol"])
-    frame.to_parquet(symbols_dir / f"{symbol}.parquet", index=False)
+
+
+_DATASETS: dict[str, dict[str, list[tuple[str, float, float, float, float, float]]]] = {
+    "gap": {
+        "AAA": [
+            ("2024-01-01T00:00:00Z", 10, 11, 9, 10.5, 100),
+            ("2024-01-01T00:02:00Z", 11, 12, 10, 11.5, 120),
+        ],
+        "BBB": [
+            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
+            ("2024-01-01T00:01:00Z", 21, 22, 20, 21.5, 210),
+            ("2024-01-01T00:02:00Z", 22, 23, 21, 22.5, 220),
+        ],
+    },
+    "interleaved": {
+        "AAA": [
+            ("2024-01-01T00:01:00Z", 10, 11, 9, 10.5, 100),
+            ("2024-01-01T00:03:00Z", 11, 12, 10, 11.5, 120),
+        ],
+        "BBB": [
+            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
+            ("2024-01-01T00:02:00Z", 21, 22, 20, 21.5, 210),
+        ],
+    },
+    "deterministic": {
+        "AAA": [
+            ("2024-01-01T00:00:00Z", 10, 11, 9, 10.5, 100),
+            ("2024-01-01T00:01:00Z", 11, 12, 10, 11.5, 120),
+        ],
+        "BBB": [
+            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
+            ("2024-01-01T00:01:00Z", 21, 22, 20, 21.5, 210),
+        ],
+    },
+    "empty_aaa": {
+        "AAA": [],
+        "BBB": [("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200)],
+    },
+}
+
+_DatasetCache = dict[str, tuple[Path, DatasetManifest]]
+
+
+@pytest.fixture(scope="session")
+def datasets_cache(tmp_path_factory: pytest.TempPathFactory) -> _DatasetCache:
+    # Manifest file paths are relative, so the parsed manifest stays valid for per-test copies.
+    cache: _DatasetCache = {}
+    for name, rows_by_symbol in _DATASETS.items():
+        dataset_dir = tmp_path_factory.mktemp(f"feed_merge_{name}")
+        _write_legacy_manifest(dataset_dir, list(rows_by_symbol))
+        write_partitioned_bars(
+            dataset_dir,
+            (_symbol_table(symbol, rows) for symbol, rows in rows_by_symbol.items()),
+            rows_by_symbol,
+        )
+        cache[name] = (dataset_dir, load_dataset_manifest(str(dataset_dir)))
+    return cache
 
 
 def _collect(feed: StreamingHistoricalDataFeed):
     out = []
+    # One OHLCV row per symbol, reused across ticks and rounded in place.
+    buf = np.empty((len(feed.symbols()), len(OHLCV_COLUMNS)), dtype=np.float64)
     while True:
         bars = feed.next()
         if bars is None:
             break
+        n = len(bars)
+        for i, bar in enumerate(bars.values()):
+            buf[i] = _OHLCV_GETTER(bar)
+        rows = np.round(buf[:n], 6, out=buf[:n]).tolist()
         ts = next(iter(bars.values())).ts
         snapshot = (
             ts,
             list(bars.keys()),
-            [
-                (
-                    sym,
-                    round(bar.open, 6),
-                    round(bar.high, 6),
-                    round(bar.low, 6),
-                    round(bar.close, 6),
-                    round(bar.volume, 6),
-                )
-                for sym, bar in bars.items()
-            ],
+            [(sym, *row) for sym, row in zip(bars, rows)],
         )
         out.append(snapshot)
     return out
 
 
-def test_merge_two_symbols_with_gaps_preserves_gaps(tmp_path: Path) -> None:
-    _write_legacy_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            ("2024-01-01T00:00:00Z", 10, 11, 9, 10.5, 100),
-            ("2024-01-01T00:02:00Z", 11, 12, 10, 11.5, 120),
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
-            ("2024-01-01T00:01:00Z", 21, 22, 20, 21.5, 210),
-            ("2024-01-01T00:02:00Z", 22, 23, 21, 22.5, 220),
-        ],
-    )
+def test_merge_two_symbols_with_gaps_preserves_gaps(tmp_path: Path, datasets_cache: _DatasetCache) -> None:
+    dataset_dir, manifest = datasets_cache["gap"]
+    shutil.copytree(dataset_dir, tmp_path, dirs_exist_ok=True)
 
-    manifest = load_dataset_manifest(str(tmp_path))
     feed = StreamingHistoricalDataFeed(str(tmp_path), manifest, config={})
 
     ticks = _collect(feed)
     assert len(ticks) == 3
-    assert ticks[0][0] == pd.Timestamp("2024-01-01T00:00:00Z")
+    assert ticks[0][0] == TS0
     assert ticks[0][1] == ["AAA", "BBB"]
-    assert ticks[1][0] == pd.Timestamp("2024-01-01T00:01:00Z")
+    assert ticks[1][0] == TS1
     assert ticks[1][1] == ["BBB"]
-    assert ticks[2][0] == pd.Timestamp("2024-01-01T00:02:00Z")
+    assert ticks[2][0] == TS2
     assert ticks[2][1] == ["AAA", "BBB"]
 
 
-def test_global_timestamp_ordering_is_monotonic(tmp_path: Path) -> None:
-    _write_legacy_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            ("2024-01-01T00:01:00Z", 10, 11, 9, 10.5, 100),
-            ("2024-01-01T00:03:00Z", 11, 12, 10, 11.5, 120),
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
-            ("2024-01-01T00:02:00Z", 21, 22, 20, 21.5, 210),
-        ],
-    )
+def test_global_timestamp_ordering_is_monotonic(tmp_path: Path, datasets_cache: _DatasetCache) -> None:
+    dataset_dir, manifest = datasets_cache["interleaved"]
+    shutil.copytree(dataset_dir, tmp_path, dirs_exist_ok=True)
 
-    manifest = load_dataset_manifest(str(tmp_path))
     feed = StreamingHistoricalDataFeed(str(tmp_path), manifest, config={})
     emitted = [entry[0] for entry in _collect(feed)]
 
@@ -118,26 +146,10 @@ def test_global_timestamp_ordering_is_monotonic(tmp_path: Path) -> None:
     assert all(emitted[i] < emitted[i + 1] for i in range(len(emitted) - 1))
 
 
-def test_deterministic_emission_order_same_ts(tmp_path: Path) -> None:
-    _write_legacy_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(
-        tmp_path,
-        "AAA",
-        [
-            ("2024-01-01T00:00:00Z", 10, 11, 9, 10.5, 100),
-            ("2024-01-01T00:01:00Z", 11, 12, 10, 11.5, 120),
-        ],
-    )
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [
-            ("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200),
-            ("2024-01-01T00:01:00Z", 21, 22, 20, 21.5, 210),
-        ],
-    )
+def test_deterministic_emission_order_same_ts(tmp_path: Path, datasets_cache: _DatasetCache) -> None:
+    dataset_dir, manifest = datasets_cache["deterministic"]
+    shutil.copytree(dataset_dir, tmp_path, dirs_exist_ok=True)
 
-    manifest = load_dataset_manifest(str(tmp_path))
     feed_a = StreamingHistoricalDataFeed(str(tmp_path), manifest, config={})
     run_a = _collect(feed_a)
 
@@ -149,22 +161,16 @@ def test_deterministic_emission_order_same_ts(tmp_path: Path) -> None:
     assert run_a[1][1] == manifest.symbols
 
 
-def test_empty_symbol_file_results_in_empty_feed_or_skips_symbol(tmp_path: Path) -> None:
-    _write_legacy_manifest(tmp_path, ["AAA", "BBB"])
-    _write_symbol_parquet(tmp_path, "AAA", [])
-    _write_symbol_parquet(
-        tmp_path,
-        "BBB",
-        [("2024-01-01T00:00:00Z", 20, 21, 19, 20.5, 200)],
-    )
+def test_empty_symbol_file_results_in_empty_feed_or_skips_symbol(tmp_path: Path, datasets_cache: _DatasetCache) -> None:
+    dataset_dir, manifest = datasets_cache["empty_aaa"]
+    shutil.copytree(dataset_dir, tmp_path, dirs_exist_ok=True)
 
-    manifest = load_dataset_manifest(str(tmp_path))
     feed = StreamingHistoricalDataFeed(str(tmp_path), manifest, config={})
 
     ticks = _collect(feed)
     assert ticks == [
         (
-            pd.Timestamp("2024-01-01T00:00:00Z"),
+            TS0,
             ["BBB"],
             [("BBB", 20.0, 21.0, 19.0, 20.5, 200.0)],
         )
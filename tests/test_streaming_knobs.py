@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
+import shutil
 
 import pandas as pd
 import pytest
 
 from bt.data.load_feed import load_feed
 
+TS0 = pd.Timestamp("2024-01-01T00:00:00Z")
+TS1 = TS0 + pd.Timedelta(minutes=1)
+TS2 = TS0 + pd.Timedelta(minutes=2)
+
 
 def _write_legacy_dataset(dataset_dir: Path) -> None:
     symbols_dir = dataset_dir / "symbols"
@@ -20,7 +25,7 @@ def _write_legacy_dataset(dataset_dir: Path) -> None:
 
     rows = [
         {
-            "ts": pd.Timestamp("2024-01-01T00:00:00Z"),
+            "ts": TS0,
             "open": 1.0,
             "high": 1.2,
             "low": 0.9,
@@ -28,7 +33,7 @@ def _write_legacy_dataset(dataset_dir: Path) -> None:
             "volume": 10.0,
         },
         {
-            "ts": pd.Timestamp("2024-01-01T00:01:00Z"),
+            "ts": TS1,
             "open": 2.0,
             "high": 2.2,
             "low": 1.9,
@@ -36,7 +41,7 @@ def _write_legacy_dataset(dataset_dir: Path) -> None:
             "volume": 11.0,
         },
         {
-            "ts": pd.Timestamp("2024-01-01T00:02:00Z"),
+            "ts": TS2,
             "open": 3.0,
             "high": 3.2,
             "low": 2.9,
@@ -51,6 +56,13 @@ def _write_legacy_dataset(dataset_dir: Path) -> None:
         frame.to_parquet(symbols_dir / f"{symbol}.parquet", index=False)
 
 
+@pytest.fixture(scope="session")
+def datasets_cache(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    dataset_dir = tmp_path_factory.mktemp("legacy_knobs")
+    _write_legacy_dataset(dataset_dir)
+    return {"legacy_knobs": dataset_dir}
+
+
 def _collect_ticks(dataset_dir: Path, config: dict) -> list[tuple[pd.Timestamp, list[str]]]:
     feed = load_feed(str(dataset_dir), config)
     out: list[tuple[pd.Timestamp, list[str]]] = []
@@ -63,46 +75,44 @@ def _collect_ticks(dataset_dir: Path, config: dict) -> list[tuple[pd.Timestamp,
     return out
 
 
-def test_date_range_filters_rows_end_exclusive(tmp_path: Path) -> None:
-    _write_legacy_dataset(tmp_path)
-    t1 = pd.Timestamp("2024-01-01T00:01:00Z")
-    t2 = pd.Timestamp("2024-01-01T00:02:00Z")
+def test_date_range_filters_rows_end_exclusive(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["legacy_knobs"], tmp_path, dirs_exist_ok=True)
 
     ticks = _collect_ticks(
         tmp_path,
-        {"data": {"date_range": {"start": t1.isoformat(), "end": t2.isoformat()}}},
+        {"data": {"date_range": {"start": TS1.isoformat(), "end": TS2.isoformat()}}},
     )
 
-    assert [ts for ts, _ in ticks] == [t1]
+    assert [ts for ts, _ in ticks] == [TS1]
     assert ticks[0][1] == ["AAA", "BBB"]
 
 
-def test_row_limit_per_symbol_limits_each_symbol_independently(tmp_path: Path) -> None:
-    _write_legacy_dataset(tmp_path)
+def test_row_limit_per_symbol_limits_each_symbol_independently(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["legacy_knobs"], tmp_path, dirs_exist_ok=True)
 
     ticks = _collect_ticks(tmp_path, {"data": {"row_limit_per_symbol": 1}})
 
     assert len(ticks) == 1
-    assert ticks[0][0] == pd.Timestamp("2024-01-01T00:00:00Z")
+    assert ticks[0][0] == TS0
     assert ticks[0][1] == ["AAA", "BBB"]
 
 
-def test_chunksize_validation_rejects_non_positive(tmp_path: Path) -> None:
-    _write_legacy_dataset(tmp_path)
+def test_chunksize_validation_rejects_non_positive(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["legacy_knobs"], tmp_path, dirs_exist_ok=True)
 
     with pytest.raises(ValueError, match="data.chunksize"):
         load_feed(str(tmp_path), {"data": {"chunksize": 0}})
 
 
-def test_row_limit_validation_rejects_non_positive(tmp_path: Path) -> None:
-    _write_legacy_dataset(tmp_path)
+def test_row_limit_validation_rejects_non_positive(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["legacy_knobs"], tmp_path, dirs_exist_ok=True)
 
     with pytest.raises(ValueError, match="data.row_limit_per_symbol"):
         load_feed(str(tmp_path), {"data": {"row_limit_per_symbol": 0}})
 
 
-def test_date_range_validation_rejects_bad_order(tmp_path: Path) -> None:
-    _write_legacy_dataset(tmp_path)
+def test_date_range_validation_rejects_bad_order(tmp_path: Path, datasets_cache: dict[str, Path]) -> None:
+    shutil.copytree(datasets_cache["legacy_knobs"], tmp_path, dirs_exist_ok=True)
 
     with pytest.raises(ValueError, match="data.date_range"):
         load_feed(
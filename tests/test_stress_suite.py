@@ -1,35 +1,46 @@
 """Tests for stress suite execution."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import math
+from types import MappingProxyType
+from typing import Mapping
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from bt.validation.stress import StressScenario, run_stress_suite
 
 
 def _write_bars_csv(path: Path, n_bars: int = 50) -> None:
     ts_index = pd.date_range("2024-01-01", periods=n_bars, freq="D", tz="UTC")
-    rows = []
-    for idx, ts in enumerate(ts_index):
-        base = 100 + idx
-        rows.append(
-            {
-                "ts": ts,
-                "symbol": "AAA",
-                "open": base,
-                "high": base + 1,
-                "low": base - 1,
-                "close": base + 0.5,
-                "volume": 1000.0 + idx,
-            }
-        )
-    pd.DataFrame(rows).to_csv(path, index=False)
-
-
-def _base_config() -> dict[str, float | int | None]:
-    return {
+    idx = np.arange(n_bars)
+    base = 100 + idx
+    pd.DataFrame(
+        {
+            "ts": ts_index,
+            "symbol": np.full(n_bars, "AAA"),
+            "open": base,
+            "high": base + 1,
+            "low": base - 1,
+            "close": base + 0.5,
+            "volume": 1000.0 + idx,
+        }
+    ).to_csv(path, index=False)
+
+
+@pytest.fixture(scope="session")
+def bars_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # run_stress_suite only reads data_path and writes under its own output_root, so one file serves every test.
+    path = tmp_path_factory.mktemp("stress_bars") / "bars.csv"
+    _write_bars_csv(path)
+    return path
+
+
+# run_stress_suite copies config before use, so every run can share one read-only mapping.
+_BASE_CONFIG: Mapping[str, float | int | None] = MappingProxyType(
+    {
         "min_history_bars": 1,
         "lookback_bars": 1,
         "min_avg_volume": 0.0,
@@ -49,46 +60,44 @@ def _base_config() -> dict[str, float | int | None]:
         "initial_cash": 100000.0,
         "max_leverage": 5.0,
     }
-
-
-def test_stress_suite_outputs_and_summary(tmp_path: Path) -> None:
-    data_path = tmp_path / "bars.csv"
-    _write_bars_csv(data_path)
-
-    scenarios = [
-        StressScenario(name="baseline"),
-        StressScenario(name="harsh_costs", fee_mult=2.0, slippage_mult=2.0, seed_offset=1),
-        StressScenario(
-            name="delay_and_drop",
-            add_delay_bars=1,
-            drop_fill_prob=0.1,
-            seed_offset=2,
-        ),
-    ]
-
-    output_root = tmp_path / "runs_one"
-    result = run_stress_suite(
-        data_path=data_path,
-        config=_base_config(),
-        scenarios=scenarios,
-        output_root=output_root,
-        seed=123,
-    )
+)
+
+
+# StressScenario is frozen, so the scenario sets are built once per module.
+_SUITE_SCENARIOS: tuple[StressScenario, ...] = (
+    StressScenario(name="baseline"),
+    StressScenario(name="harsh_costs", fee_mult=2.0, slippage_mult=2.0, seed_offset=1),
+    StressScenario(name="delay_and_drop", add_delay_bars=1, drop_fill_prob=0.1, seed_offset=2),
+)
+_INVARIANT_SCENARIOS: tuple[StressScenario, ...] = (
+    StressScenario(name="baseline"),
+    StressScenario(name="delay_and_drop", add_delay_bars=1, drop_fill_prob=0.2),
+)
+
+
+def test_stress_suite_outputs_and_summary(tmp_path: Path, bars_csv: Path) -> None:
+    scenarios = list(_SUITE_SCENARIOS)
+
+    # Each run writes under its own output_root, so the two suites can run side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first, second = (
+            executor.submit(
+                run_stress_suite,
+                data_path=bars_csv,
+                config=_BASE_CONFIG,
+                scenarios=scenarios,
+                output_root=tmp_path / name,
+                seed=123,
+            )
+            for name in ("runs_one", "runs_two")
+        )
+        result, repeat = first.result(), second.result()
 
     assert "summary" in result
     assert "results" in result
     assert len(result["results"]) == len(scenarios)
     assert set(result["summary"].keys()) == {scenario.name for scenario in scenarios}
 
-    output_root_second = tmp_path / "runs_two"
-    repeat = run_stress_suite(
-        data_path=data_path,
-        config=_base_config(),
-        scenarios=scenarios,
-        output_root=output_root_second,
-        seed=123,
-    )
-
     for scenario in scenarios:
         left = result["summary"][scenario.name]
         right = repeat["summary"][scenario.name]
@@ -97,18 +106,12 @@ def test_stress_suite_outputs_and_summary(tmp_path: Path) -> None:
         assert left["n_fills"] == right["n_fills"]
 
 
-def test_stress_suite_invariants(tmp_path: Path) -> None:
-    data_path = tmp_path / "bars.csv"
-    _write_bars_csv(data_path)
-
-    scenarios = [
-        StressScenario(name="baseline"),
-        StressScenario(name="delay_and_drop", add_delay_bars=1, drop_fill_prob=0.2),
-    ]
+def test_stress_suite_invariants(tmp_path: Path, bars_csv: Path) -> None:
+    scenarios = list(_INVARIANT_SCENARIOS)
 
     result = run_stress_suite(
-        data_path=data_path,
-        config=_base_config(),
+        data_path=bars_csv,
+        config=_BASE_CONFIG,
         scenarios=scenarios,
         output_root=tmp_path / "runs",
         seed=77,
@@ -117,8 +120,11 @@ def test_stress_suite_invariants(tmp_path: Path) -> None:
     for scenario in scenarios:
         run_dir = Path(result["summary"][scenario.name]["run_dir"])
         equity_path = run_dir / "equity.csv"
-        equity_df = pd.read_csv(equity_path)
-        assert "equity" in equity_df.columns
-        for value in equity_df["equity"].tolist():
-            assert value == value
-            assert math.isfinite(value)
+        with equity_path.open() as handle:
+            header = handle.readline().rstrip("\n").split(",")
+        assert "equity" in header
+        # equity.csv is unquoted numeric columns after ts, so loadtxt can pull the one column straight into float64.
+        equity = np.loadtxt(
+            equity_path, delimiter=",", skiprows=1, usecols=header.index("equity"), dtype=np.float64, ndmin=1
+        )
+        assert np.isfinite(equity).all()
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
 
 from bt.logging.summary import write_summary_txt
-
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+from tests.helpers.json_io import write_json
 
 
 def _write_required_run_artifacts(run_dir: Path) -> None:
@@ -34,7 +30,7 @@ def _write_required_run_artifacts(run_dir: Path) -> None:
         "longest_loss_streak": 2,
         "max_drawdown_duration": 4,
     }
-    _write_json(run_dir / "performance.json", perf)
+    write_json(run_dir / "performance.json", perf)
     (run_dir / "trades.csv").write_text(
         "entry_ts,exit_ts,symbol,side,pnl,r_multiple_net\n"
         "2024-01-01,2024-01-02,BTCUSDT,LONG,1.0,0.5\n"
@@ -93,7 +89,7 @@ def test_benchmark_enabled_missing_artifact_raises(tmp_path: Path) -> None:
     run_dir = tmp_path / "run_004"
     run_dir.mkdir()
     _write_required_run_artifacts(run_dir)
-    _write_json(run_dir / "run_manifest.json", {"benchmark_enabled": True})
+    write_json(run_dir / "run_manifest.json", {"benchmark_enabled": True})
 
     with pytest.raises(ValueError, match=r"run_dir=.*comparison_summary\.json"):
         write_summary_txt(run_dir)
@@ -19,9 +19,7 @@ def _write_csv(path, rows: list[dict[str, object]]) -> None:
 
 
 def _write_parquet(path, rows: list[dict[str, object]]) -> None:
-    frame = pd.DataFrame(rows)
-    table = pa.Table.from_pandas(frame, preserve_index=False)
-    pq.write_table(table, path)
+    pq.write_table(pa.Table.from_pylist(rows), path, compression="snappy")
 
 
 def test_monotonicity_violation_raises_csv(tmp_path) -> None:
@@ -103,13 +101,13 @@ def test_missing_bars_not_synthesized(tmp_path) -> None:
 
 
 def test_date_range_filter_works(tmp_path) -> None:
-    path = tmp_path / "aaa.csv"
-    _write_csv(
+    path = tmp_path / "aaa.parquet"
+    _write_parquet(
         path,
         [
-            {"ts": _ts(0).isoformat(), "open": 1, "high": 2, "low": 1, "close": 1.5, "volume": 10},
-            {"ts": _ts(1).isoformat(), "open": 2, "high": 3, "low": 1.5, "close": 2.5, "volume": 11},
-            {"ts": _ts(2).isoformat(), "open": 3, "high": 4, "low": 2.5, "close": 3.5, "volume": 12},
+            {"ts": _ts(0), "open": 1, "high": 2, "low": 1, "close": 1.5, "volume": 10},
+            {"ts": _ts(1), "open": 2, "high": 3, "low": 1.5, "close": 2.5, "volume": 11},
+            {"ts": _ts(2), "open": 3, "high": 4, "low": 2.5, "close": 3.5, "volume": 12},
         ],
     )
 
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
+import functools
+import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Mapping
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from bt.api import _build_engine
@@ -12,6 +18,8 @@ from bt.core.config_resolver import resolve_config
 from bt.data.feed import HistoricalDataFeed
 from bt.strategy.base import Strategy
 
+_T0 = pd.Timestamp("2025-01-01 00:00:00", tz="UTC")
+
 
 @dataclass
 class _CaptureStrategy(Strategy):
@@ -20,33 +28,45 @@ class _CaptureStrategy(Strategy):
     def on_bars(self, ts, bars_by_symbol, tradeable, ctx: Mapping[str, Any]):
         htf = ctx.get("htf", {}) if isinstance(ctx, Mapping) else {}
         if isinstance(htf, Mapping):
+            emitted = self.emitted_htf
             for tf, by_symbol in htf.items():
                 if not isinstance(by_symbol, Mapping):
                     continue
-                for symbol, bar in by_symbol.items():
-                    self.emitted_htf.append((bar.ts, str(tf), str(symbol), int(bar.n_bars), int(bar.expected_bars)))
+                emitted.extend(
+                    (bar.ts, str(tf), str(symbol), int(bar.n_bars), int(bar.expected_bars))
+                    for symbol, bar in by_symbol.items()
+                )
         return []
 
 
 def _bars_df(minutes: list[int]) -> pd.DataFrame:
-    rows = []
-    for minute in minutes:
-        ts = pd.Timestamp("2025-01-01 00:00:00", tz="UTC") + pd.Timedelta(minutes=minute)
-        rows.append(
-            {
-                "ts": ts,
-                "symbol": "AAA",
-                "open": 100.0 + minute,
-                "high": 101.0 + minute,
-                "low": 99.0 + minute,
-                "close": 100.5 + minute,
-                "volume": 1.0,
-            }
-        )
-    return pd.DataFrame(rows)
-
-
-def _run_with_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, cfg: dict[str, Any], bars_df: pd.DataFrame):
+    minutes_arr = np.asarray(minutes, dtype=np.int64)
+    return pd.DataFrame(
+        {
+            "ts": _T0 + pd.to_timedelta(minutes_arr, unit="m"),
+            "symbol": "AAA",
+            "open": 100.0 + minutes_arr,
+            "high": 101.0 + minutes_arr,
+            "low": 99.0 + minutes_arr,
+            "close": 100.5 + minutes_arr,
+            "volume": 1.0,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_cached(key: str) -> dict[str, Any]:
+    return resolve_config(json.loads(key))
+
+
+def _bars_table(minutes: list[int]) -> pa.Table:
+    return pa.Table.from_pandas(_bars_df(minutes), preserve_index=False)
+
+
+_BARS_16M = _bars_table(list(range(0, 16)))
+
+
+def _run_with_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, cfg: dict[str, Any], bars: pa.Table):
     capture = _CaptureStrategy()
 
     def _factory(name: str, seed: int = 42, **kwargs: Any):
@@ -54,32 +74,37 @@ def _run_with_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, cfg: dict[
 
     monkeypatch.setattr("bt.strategy.make_strategy", _factory)
 
-    resolved = resolve_config(cfg)
+    # Engines may mutate the resolved config, so each run gets its own copy of the cached result.
+    resolved = copy.deepcopy(_resolve_cached(json.dumps(cfg, sort_keys=True, default=str)))
     engine = _build_engine(
         resolved,
-        HistoricalDataFeed(bars_df),
+        HistoricalDataFeed.from_arrow(bars),
         tmp_path,
     )
     engine.run()
     return capture.emitted_htf
 
 
-def _base_config() -> dict[str, Any]:
-    return {
+_BASE_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
         "strategy": {"name": "coinflip"},
         "risk": {"mode": "equity_pct", "r_per_trade": 0.005},
         "htf_resampler": {"timeframes": ["5m"], "strict": True},
     }
+)
 
 
-def test_default_preserves_behavior_when_timeframe_unset(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    bars_df = _bars_df(list(range(0, 16)))
+def _base_config() -> dict[str, Any]:
+    # Tests only replace top-level keys and resolve_config deep-copies its input, so a shallow copy suffices.
+    return dict(_BASE_CONFIG)
+
 
-    baseline = _run_with_config(monkeypatch, tmp_path / "baseline", _base_config(), bars_df)
+def test_default_preserves_behavior_when_timeframe_unset(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    baseline = _run_with_config(monkeypatch, tmp_path / "baseline", _base_config(), _BARS_16M)
 
     cfg_with_data_but_no_timeframe = _base_config()
     cfg_with_data_but_no_timeframe["data"] = {"mode": "dataframe"}
-    comparison = _run_with_config(monkeypatch, tmp_path / "comparison", cfg_with_data_but_no_timeframe, bars_df)
+    comparison = _run_with_config(monkeypatch, tmp_path / "comparison", cfg_with_data_but_no_timeframe, _BARS_16M)
 
     assert comparison == baseline
 
@@ -89,11 +114,9 @@ def test_timeframe_15m_alias_is_not_used_for_htf_context_when_driving_engine_tim
     tmp_path: Path,
 ) -> None:
     minutes = [m for m in range(0, 31) if m != 20]
-    bars_df = _bars_df(minutes)
-
     cfg = _base_config()
     cfg["data"] = {"mode": "dataframe", "engine_timeframe": "15m"}
-    emitted = _run_with_config(monkeypatch, tmp_path / "tf15m", cfg, bars_df)
+    emitted = _run_with_config(monkeypatch, tmp_path / "tf15m", cfg, _bars_table(minutes))
 
     assert emitted and all(item[1] == "5m" for item in emitted)
 
@@ -102,7 +125,6 @@ def test_research_panel_timeframe_does_not_override_signal_htf_resampler(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    bars_df = _bars_df(list(range(0, 16)))
     cfg = _base_config()
     cfg["data"] = {
         "mode": "dataframe",
@@ -114,7 +136,7 @@ def test_research_panel_timeframe_does_not_override_signal_htf_resampler(
     }
     cfg["htf_resampler"] = {"timeframes": ["15m"], "strict": True}
 
-    emitted = _run_with_config(monkeypatch, tmp_path / "research_panel", cfg, bars_df)
+    emitted = _run_with_config(monkeypatch, tmp_path / "research_panel", cfg, _BARS_16M)
 
     assert emitted
     assert all(item[1] == "15m" for item in emitted)
@@ -134,11 +156,10 @@ def test_resolved_config_omits_legacy_htf_aliases_when_resampler_is_effective()
 
 
 def test_invalid_timeframe_raises_valueerror(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    bars_df = _bars_df(list(range(0, 6)))
     cfg = _base_config()
     cfg["data"] = {"mode": "dataframe", "timeframe": "banana"}
 
     with pytest.raises(ValueError, match=r"data\.engine_timeframe") as exc_info:
-        _run_with_config(monkeypatch, tmp_path / "invalid", cfg, bars_df)
+        _run_with_config(monkeypatch, tmp_path / "invalid", cfg, _bars_table(list(range(0, 6))))
 
     assert "1m" in str(exc_info.value)
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pac
 import pytest
 
 from bt.core.enums import Side
 from bt.core.types import Trade
 from bt.logging.trades import TradesCsvWriter
-from bt.risk.r_multiple import compute_r_multiple
+from bt.risk.r_multiple import compute_r_multiple, compute_r_multiple_arr
+
+
+def _write_single_trade(path: Path, trade: Trade) -> list[dict]:
+    writer = TradesCsvWriter(path, force_flush_after=None)
+    writer.write_trade(trade)
+    writer.close()
+    # Arrow types numeric columns on read; empty cells come back as None.
+    return pac.read_csv(path).to_pylist()
 
 
 def test_compute_r_multiple() -> None:
@@ -20,10 +29,20 @@ def test_compute_r_multiple() -> None:
     assert compute_r_multiple(10.0, -1.0) is None
 
 
+def test_compute_r_multiple_arr_matches_scalar() -> None:
+    rng = np.random.default_rng(7)
+    pnl = rng.normal(0.0, 100.0, size=10_000)
+    risk = rng.normal(50.0, 50.0, size=10_000)
+    risk[::97] = 0.0
+
+    result = compute_r_multiple_arr(pnl, risk)
+
+    expected = [compute_r_multiple(p, r) for p, r in zip(pnl.tolist(), risk.tolist())]
+    assert np.array_equal(result, np.array([np.nan if value is None else value for value in expected]), equal_nan=True)
+
+
 def test_trades_csv_contains_risk_and_r_multiple_columns(tmp_path: Path) -> None:
     path = tmp_path / "trades.csv"
-    writer = TradesCsvWriter(path)
-
     trade = Trade(
         symbol="BTC",
         side=Side.BUY,
@@ -39,11 +58,7 @@ def test_trades_csv_contains_risk_and_r_multiple_columns(tmp_path: Path) -> None
         mfe_price=112.0,
         metadata={"risk_amount": 100.0, "stop_distance": 5.0},
     )
-    writer.write_trade(trade)
-    writer.close()
-
-    with path.open(encoding="utf-8", newline="") as handle:
-        rows = list(csv.DictReader(handle))
+    rows = _write_single_trade(path, trade)
 
     assert rows
     row = rows[0]
@@ -56,22 +71,20 @@ def test_trades_csv_contains_risk_and_r_multiple_columns(tmp_path: Path) -> None
     assert "r_multiple_gross" in row
     assert "r_multiple_net" in row
 
-    assert float(row["risk_amount"]) == 100.0
-    assert float(row["stop_distance"]) == 5.0
-    assert float(row["entry_stop_distance"]) == 5.0
-    assert float(row["entry_qty"]) == 2.0
-    assert float(row["exit_qty"]) == 2.0
+    assert row["risk_amount"] == 100.0
+    assert row["stop_distance"] == 5.0
+    assert row["entry_stop_distance"] == 5.0
+    assert row["entry_qty"] == 2.0
+    assert row["exit_qty"] == 2.0
 
     pnl_price = trade.pnl
     pnl_net = trade.pnl - trade.fees
-    assert float(row["r_multiple_gross"]) == pnl_price / 100.0
-    assert float(row["r_multiple_net"]) == pnl_net / 100.0
+    assert row["r_multiple_gross"] == pnl_price / 100.0
+    assert row["r_multiple_net"] == pnl_net / 100.0
 
 
 def test_trades_csv_legacy_trade_without_risk_metadata(tmp_path: Path) -> None:
     path = tmp_path / "trades.csv"
-    writer = TradesCsvWriter(path)
-
     trade = Trade(
         symbol="ETH",
         side=Side.SELL,
@@ -87,27 +100,21 @@ def test_trades_csv_legacy_trade_without_risk_metadata(tmp_path: Path) -> None:
         mfe_price=180.0,
         metadata={},
     )
-    writer.write_trade(trade)
-    writer.close()
-
-    with path.open(encoding="utf-8", newline="") as handle:
-        rows = list(csv.DictReader(handle))
+    rows = _write_single_trade(path, trade)
 
     assert rows
     row = rows[0]
-    assert row["risk_amount"] == ""
-    assert row["stop_distance"] == ""
-    assert row["entry_stop_distance"] == ""
-    assert float(row["entry_qty"]) == 1.0
-    assert float(row["exit_qty"]) == 1.0
-    assert row["r_multiple_gross"] == ""
-    assert row["r_multiple_net"] == ""
+    assert row["risk_amount"] is None
+    assert row["stop_distance"] is None
+    assert row["entry_stop_distance"] is None
+    assert row["entry_qty"] == 1.0
+    assert row["exit_qty"] == 1.0
+    assert row["r_multiple_gross"] is None
+    assert row["r_multiple_net"] is None
 
 
 def test_trades_csv_supports_distinct_entry_qty_and_exit_qty_for_partial_close(tmp_path: Path) -> None:
     path = tmp_path / "trades.csv"
-    writer = TradesCsvWriter(path)
-
     trade = Trade(
         symbol="BTC",
         side=Side.BUY,
@@ -123,22 +130,16 @@ def test_trades_csv_supports_distinct_entry_qty_and_exit_qty_for_partial_close(t
         mfe_price=106.0,
         metadata={"entry_qty": 1.0, "risk_amount": 50.0, "stop_distance": 50.0},
     )
-    writer.write_trade(trade)
-    writer.close()
-
-    with path.open(encoding="utf-8", newline="") as handle:
-        rows = list(csv.DictReader(handle))
+    rows = _write_single_trade(path, trade)
 
     row = rows[0]
-    assert float(row["entry_qty"]) == 1.0
-    assert float(row["exit_qty"]) == 0.4
-    assert float(row["r_multiple_gross"]) == pytest.approx(2.0 / 50.0)
+    assert row["entry_qty"] == 1.0
+    assert row["exit_qty"] == 0.4
+    assert row["r_multiple_gross"] == pytest.approx(2.0 / 50.0)
 
 
 def test_trades_csv_computes_path_r_with_entry_stop_distance_only(tmp_path: Path) -> None:
     path = tmp_path / "trades.csv"
-    writer = TradesCsvWriter(path)
-
     trade = Trade(
         symbol="BTC",
         side=Side.BUY,
@@ -154,14 +155,10 @@ def test_trades_csv_computes_path_r_with_entry_stop_distance_only(tmp_path: Path
         mfe_price=106.0,
         metadata={"risk_amount": 25.0, "entry_stop_distance": 5.0},
     )
-    writer.write_trade(trade)
-    writer.close()
-
-    with path.open(encoding="utf-8", newline="") as handle:
-        row = next(csv.DictReader(handle))
+    row = _write_single_trade(path, trade)[0]
 
-    assert float(row["entry_stop_distance"]) == pytest.approx(5.0)
-    assert float(row["mfe_r"]) == pytest.approx((106.0 - 100.0) / 5.0)
-    assert float(row["mae_r"]) == pytest.approx((100.0 - 98.0) / 5.0)
-    assert float(row["r_multiple_gross"]) == pytest.approx(8.0 / 25.0)
-    assert float(row["r_multiple_net"]) == pytest.approx((8.0 - 1.0) / 25.0)
+    assert row["entry_stop_distance"] == pytest.approx(5.0)
+    assert row["mfe_r"] == pytest.approx((106.0 - 100.0) / 5.0)
+    assert row["mae_r"] == pytest.approx((100.0 - 98.0) / 5.0)
+    assert row["r_multiple_gross"] == pytest.approx(8.0 / 25.0)
+    assert row["r_multiple_net"] == pytest.approx((8.0 - 1.0) / 25.0)
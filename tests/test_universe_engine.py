@@ -1,22 +1,19 @@
 """Tests for UniverseEngine."""
 from __future__ import annotations
 
+import dataclasses
+
 import pandas as pd
 
 from bt.core.types import Bar
 from bt.universe.universe import UniverseEngine
 
 
+_TEMPLATE = Bar(ts=pd.Timestamp(0, tz="UTC"), symbol="", open=1.0, high=1.0, low=1.0, close=1.0, volume=0.0)
+
+
 def _bar(ts: pd.Timestamp, symbol: str, volume: float) -> Bar:
-    return Bar(
-        ts=ts,
-        symbol=symbol,
-        open=1.0,
-        high=1.0,
-        low=1.0,
-        close=1.0,
-        volume=volume,
-    )
+    return dataclasses.replace(_TEMPLATE, ts=ts, symbol=symbol, volume=volume)
 
 
 def test_universe_requires_history() -> None:
@@ -24,8 +21,7 @@ def test_universe_requires_history() -> None:
     t0 = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
     t1 = pd.Timestamp("2024-01-01 00:01:00", tz="UTC")
 
-    engine.update(_bar(t0, "AAA", 10.0))
-    engine.update(_bar(t1, "AAA", 10.0))
+    engine.update_many([_bar(t0, "AAA", 10.0), _bar(t1, "AAA", 10.0)])
 
     assert engine.tradeable_at(t1) == set()
 
@@ -40,9 +36,14 @@ def test_universe_volume_threshold() -> None:
     t0 = pd.Timestamp("2024-01-01 00:00:00", tz="UTC")
     t1 = pd.Timestamp("2024-01-01 00:01:00", tz="UTC")
 
-    for ts in (t0, t1):
-        engine.update(_bar(ts, "AAA", 100.0))
-        engine.update(_bar(ts, "BBB", 10.0))
+    engine.update_many(
+        [
+            _bar(t0, "AAA", 100.0),
+            _bar(t0, "BBB", 10.0),
+            _bar(t1, "AAA", 100.0),
+            _bar(t1, "BBB", 10.0),
+        ]
+    )
 
     assert engine.tradeable_at(t1) == {"AAA"}
 
@@ -59,9 +60,7 @@ def test_universe_lag_prevents_peeking() -> None:
     t2 = pd.Timestamp("2024-01-01 00:02:00", tz="UTC")
     t3 = pd.Timestamp("2024-01-01 00:03:00", tz="UTC")
 
-    engine.update(_bar(t0, "AAA", 1.0))
-    engine.update(_bar(t1, "AAA", 1.0))
-    engine.update(_bar(t2, "AAA", 1000.0))
+    engine.update_many([_bar(t0, "AAA", 1.0), _bar(t1, "AAA", 1.0), _bar(t2, "AAA", 1000.0)])
 
     assert engine.tradeable_at(t2) == set()
 
@@ -80,11 +79,15 @@ def test_universe_handles_missing_bars() -> None:
     t1 = pd.Timestamp("2024-01-01 00:01:00", tz="UTC")
     t2 = pd.Timestamp("2024-01-01 00:02:00", tz="UTC")
 
-    engine.update(_bar(t0, "AAA", 10.0))
-    engine.update(_bar(t0, "BBB", 1.0))
-    engine.update(_bar(t1, "AAA", 10.0))
-    engine.update(_bar(t2, "AAA", 10.0))
-    engine.update(_bar(t2, "BBB", 1.0))
+    engine.update_many(
+        [
+            _bar(t0, "AAA", 10.0),
+            _bar(t0, "BBB", 1.0),
+            _bar(t1, "AAA", 10.0),
+            _bar(t2, "AAA", 10.0),
+            _bar(t2, "BBB", 1.0),
+        ]
+    )
 
     assert engine.tradeable_at(t1) == {"AAA"}
     assert engine.tradeable_at(t2) == {"AAA"}
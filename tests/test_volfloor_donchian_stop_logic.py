@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from bt.core.enums import Side
 from bt.strategy.volfloor_donchian import VolFloorDonchianStrategy
 
@@ -61,3 +63,8 @@ def test_invalid_combinations_return_none() -> None:
         structural_stop=107.0,
         atr_stop=None,
     ) is None
+
+
+def test_unknown_stop_mode_rejected_at_construction() -> None:
+    with pytest.raises(ValueError, match="Unsupported stop_mode='chandelier'"):
+        VolFloorDonchianStrategy(stop_mode="chandelier")